@@ -15,10 +15,9 @@ Usage:
 Fast iteration: Calls market_data.py functions directly (no MCP layer)
 """
 
-import argparse
-import asyncio
-import json
 import sys
+from types import SimpleNamespace
+from typing import Any
 
 from .market_data import (
     format_markets,
@@ -34,28 +33,38 @@ from .market_data import (
     get_ticker_screen_data,
     get_ticker_screen_data_batch,
 )
-from .server import list_tools
-
-
-async def list_tools_command() -> int:
-    """Show MCP tool definitions"""
-    tools = await list_tools()
-
-    print("=" * 80)
-    print("MCP TOOL DEFINITIONS")
-    print("=" * 80)
-    print()
-
-    for tool in tools:
-        print(f"Tool: {tool.name}")
-        print(f"Claude sees: mcp__idio-yf__{tool.name}")
-        print()
-        print("Description:")
-        print(tool.description)
-        print()
-        print("Input Schema:")
-        print(json.dumps(tool.inputSchema, indent=2))
-        print()
+from .tools import get_mcp_tools
+
+# Schema pretty-printing: orjson (C encoder) when installed, stdlib json otherwise.
+# Same text either way for these ASCII schemas
+try:
+    import orjson
+
+    def _pretty(obj: Any) -> str:  # noqa: ANN401
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:
+    import json
+
+    def _pretty(obj: Any) -> str:  # noqa: ANN401
+        return json.dumps(obj, indent=2)
+
+
+def list_tools_command() -> int:
+    """Show MCP tool definitions (same tuple server.list_tools returns)"""
+    # Assemble the whole listing, then one write (not ~40 print calls)
+    rule = "=" * 80
+    out = [f"{rule}\nMCP TOOL DEFINITIONS\n{rule}\n\n"]
+    for tool in get_mcp_tools():
+        # inputSchema is the field name in the locked mcp (renamed in newer releases)
+        schema = tool.inputSchema  # type: ignore[attr-defined,unused-ignore]
+        out.append(
+            f"Tool: {tool.name}\n"
+            f"Claude sees: mcp__idio-yf__{tool.name}\n\n"
+            f"Description:\n{tool.description}\n\n"
+            f"Input Schema:\n{_pretty(schema)}\n\n"
+        )
+    sys.stdout.write("".join(out))
 
     return 0
 
@@ -107,8 +116,43 @@ def options_command(symbol: str, expiration: str = "nearest") -> int:
     return 0
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments"""
+def _parse_args_fast(argv: list[str]) -> SimpleNamespace | None:  # noqa: PLR0911
+    """
+    Parse well-formed invocations by hand - argparse's import and parser setup
+    cost more than the whole parse for these few positional commands.
+
+    Returns None for anything else (flags like --help, wrong arity, unknown
+    command) so argparse produces the usual help and error output.
+    """
+    if not argv:
+        return SimpleNamespace(command=None)
+    if any(arg.startswith("-") for arg in argv):
+        return None
+
+    command, *rest = argv
+    n = len(rest)
+    if command in ("list-tools", "markets") and n == 0:
+        return SimpleNamespace(command=command)
+    if command == "sector" and n == 1:
+        return SimpleNamespace(command=command, name=rest[0])
+    if command == "ticker" and n >= 1:
+        return SimpleNamespace(command=command, symbols=rest)
+    if command == "news" and n == 1:
+        return SimpleNamespace(command=command, symbol=rest[0])
+    if command == "options" and n in (1, 2):
+        expiration = rest[1] if n == 2 else "nearest"  # noqa: PLR2004
+        return SimpleNamespace(command=command, symbol=rest[0], expiration=expiration)
+    return None
+
+
+def parse_args() -> SimpleNamespace:
+    """Parse command line arguments (fast path, argparse for help/errors)"""
+    fast = _parse_args_fast(sys.argv[1:])
+    if fast is not None:
+        return fast
+
+    import argparse  # noqa: PLC0415
+
     parser = argparse.ArgumentParser(
         description="CLI for yfinance MCP screens",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -159,10 +203,11 @@ Examples:
         help="Expiration date (default: nearest, or YYYY-MM-DD)",
     )
 
-    return parser.parse_args()
+    return SimpleNamespace(**vars(parser.parse_args()))
 
 
-async def async_main() -> int:  # noqa: PLR0911
+def main() -> int:  # noqa: PLR0911
+    # Every command is synchronous - no event loop to build or tear down
     args = parse_args()
 
     if not args.command:
@@ -171,7 +216,7 @@ async def async_main() -> int:  # noqa: PLR0911
         return 1
 
     if args.command == "list-tools":
-        return await list_tools_command()
+        return list_tools_command()
 
     if args.command == "markets":
         return markets_command()
@@ -192,9 +237,5 @@ async def async_main() -> int:  # noqa: PLR0911
     return 1
 
 
-def main() -> int:
-    return asyncio.run(async_main())
-
-
 if __name__ == "__main__":
     sys.exit(main())
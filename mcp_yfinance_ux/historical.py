@@ -3,37 +3,266 @@ Historical data fetching - optimized date range queries
 Separate from market_data.py business logic
 """
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime, timedelta
-from typing import Any
+import atexit
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any, TypeVar
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd  # type: ignore[import-untyped]
 import yfinance as yf  # type: ignore[import-untyped]
 
+from mcp_yfinance_ux.http_session import SESSION
 
-def calculate_date_range(months: int) -> tuple[str, str]:
+_ET = ZoneInfo("America/New_York")  # Resolved once at import
+
+# Long-lived worker pools - no thread spawn/join per request.
+# Two tiers so a fan-out task never blocks on a pool it is itself occupying:
+# FANOUT_EXECUTOR runs per-symbol work (screens, snapshots); LOOKUP_EXECUTOR runs
+# the small lookups those tasks parallelize and never submits further work
+FANOUT_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="yfx-fanout")
+LOOKUP_EXECUTOR = ThreadPoolExecutor(max_workers=32, thread_name_prefix="yfx-lookup")
+atexit.register(FANOUT_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+atexit.register(LOOKUP_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+
+# yf.Ticker caches info/fast_info internally - reuse instances, but bound staleness
+TICKER_CACHE_TTL_SECONDS = 60
+TICKER_CACHE_MAX_ENTRIES = 2048
+INFO_CACHE_TTL_SECONDS = 60
+INFO_CACHE_MAX_ENTRIES = 1024
+
+# Quote fields (fast_info) - short TTL, they are the live numbers on every screen
+FAST_INFO_CACHE_TTL_SECONDS = 30
+FAST_INFO_CACHE_MAX_ENTRIES = 2048
+FAST_INFO_KEYS = ("lastPrice", "previousClose")
+
+# Option chains move intraday, but not within a minute
+OPTION_CHAIN_CACHE_TTL_SECONDS = 60
+OPTION_CHAIN_CACHE_MAX_ENTRIES = 256  # Each entry holds two parsed DataFrames
+
+# symbol -> (created_at, yf.Ticker); evicted early when a lookup through it fails
+_TICKER_CACHE: dict[str, tuple[float, Any]] = {}
+_TICKER_CACHE_LOCK = threading.Lock()
+
+# symbol -> (fetched_at, info dict); shared by every Ticker instance for that symbol
+_INFO_CACHE: dict[str, tuple[float, dict[str, Any]]] = {}
+_INFO_CACHE_LOCK = threading.Lock()
+
+# symbol -> (fetched_at, {key: value} for FAST_INFO_KEYS present)
+_FAST_INFO_CACHE: dict[str, tuple[float, dict[str, Any]]] = {}
+_FAST_INFO_CACHE_LOCK = threading.Lock()
+
+# (symbol, expiration) -> (fetched_at, option chain)
+_OPTION_CHAIN_CACHE: dict[tuple[str, str], tuple[float, Any]] = {}
+_OPTION_CHAIN_CACHE_LOCK = threading.Lock()
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+def _cache_put(
+    cache: dict[K, tuple[float, V]], key: K, value: V, ttl_seconds: float, max_entries: int
+) -> None:
     """
-    Calculate start/end dates for historical data fetch
+    Store (fetched_at, value) in a TTL cache, keeping it at most max_entries
+
+    At capacity, expired entries are swept first, then the oldest insert is dropped
+    (same policy as server_http's response cache). Re-inserting moves the key to
+    the end, so dict order is age order. Caller holds the cache's lock.
+    """
+    now = time.monotonic()
+    cache.pop(key, None)
+    if len(cache) >= max_entries:
+        for stale in [k for k, (fetched_at, _) in cache.items() if now - fetched_at >= ttl_seconds]:
+            del cache[stale]
+        if len(cache) >= max_entries:
+            del cache[next(iter(cache))]
+    cache[key] = (now, value)
+
+
+def get_ticker(symbol: str) -> Any:  # Returns yf.Ticker  # noqa: ANN401
+    """
+    Get a shared yf.Ticker for symbol
+
+    Reusing the instance reuses yfinance's internal info/fast_info cache
+    (refreshed every TICKER_CACHE_TTL_SECONDS). yfinance also keeps failure state
+    on the instance, so lookups that fail through it call _evict_ticker - the next
+    caller gets a fresh Ticker instead of the failure for the rest of the TTL.
+    """
+    now = time.monotonic()
+    with _TICKER_CACHE_LOCK:
+        entry = _TICKER_CACHE.get(symbol)
+        if entry is not None and now - entry[0] < TICKER_CACHE_TTL_SECONDS:
+            return entry[1]
+        ticker = yf.Ticker(symbol, session=SESSION)  # Lazy - no network until used
+        _cache_put(
+            _TICKER_CACHE, symbol, ticker, TICKER_CACHE_TTL_SECONDS, TICKER_CACHE_MAX_ENTRIES
+        )
+    return ticker
+
+
+def _evict_ticker(symbol: str) -> None:
+    """Drop symbol's shared yf.Ticker after a failed lookup (next get_ticker builds a new one)"""
+    with _TICKER_CACHE_LOCK:
+        _TICKER_CACHE.pop(symbol, None)
+
+
+def clear_ticker_cache() -> None:
+    """Drop every shared yf.Ticker, cached info/quote and option chain (next lookup refetches)"""
+    with _TICKER_CACHE_LOCK:
+        _TICKER_CACHE.clear()
+    with _INFO_CACHE_LOCK:
+        _INFO_CACHE.clear()
+    with _FAST_INFO_CACHE_LOCK:
+        _FAST_INFO_CACHE.clear()
+    with _OPTION_CHAIN_CACHE_LOCK:
+        _OPTION_CHAIN_CACHE.clear()
+
+
+def get_ticker_info(symbol: str, ticker: Any = None) -> dict[str, Any]:  # noqa: ANN401
+    """
+    Get ticker.info for symbol, cached module-wide for INFO_CACHE_TTL_SECONDS
+
+    The info scrape is the slowest Yahoo call; this dedupes it across tools and
+    across separate Ticker instances (e.g. an explicitly passed Ticker vs get_ticker)
 
     Args:
-        months: Number of months of history (minimal buffer for weekends/holidays)
+        symbol: Ticker symbol
+        ticker: Existing yf.Ticker to fetch through on a miss (default: get_ticker)
 
-    Returns:
-        Tuple of (start_date, end_date) as ISO strings
+    Raises:
+        LookupError: yfinance returned no info (None/empty) for symbol
+    """
+    now = time.monotonic()
+    with _INFO_CACHE_LOCK:
+        entry = _INFO_CACHE.get(symbol)
+    if entry is not None and now - entry[0] < INFO_CACHE_TTL_SECONDS:
+        return entry[1]
+
+    try:
+        info: dict[str, Any] | None = (ticker if ticker is not None else get_ticker(symbol)).info
+    except Exception:
+        _evict_ticker(symbol)
+        raise
+    if not info:
+        # Failed scrape: don't let the Ticker replay the empty result for its TTL
+        _evict_ticker(symbol)
+        msg = f"No info data returned for {symbol}"
+        raise LookupError(msg)
+
+    with _INFO_CACHE_LOCK:
+        _cache_put(_INFO_CACHE, symbol, info, INFO_CACHE_TTL_SECONDS, INFO_CACHE_MAX_ENTRIES)
+    return info
+
+
+def get_fast_info(symbol: str, ticker: Any = None) -> dict[str, Any]:  # noqa: ANN401
+    """
+    Get lastPrice/previousClose from ticker.fast_info, cached for FAST_INFO_CACHE_TTL_SECONDS
+
+    Keys yfinance has no value for are left out, so .get(key, default) behaves
+    like it did on fast_info itself. An empty quote (failed read) is returned
+    but not cached.
+
+    Args:
+        symbol: Ticker symbol
+        ticker: Existing yf.Ticker to fetch through on a miss (default: get_ticker)
+    """
+    now = time.monotonic()
+    with _FAST_INFO_CACHE_LOCK:
+        entry = _FAST_INFO_CACHE.get(symbol)
+    if entry is not None and now - entry[0] < FAST_INFO_CACHE_TTL_SECONDS:
+        return entry[1]
+
+    try:
+        fast_info = (ticker if ticker is not None else get_ticker(symbol)).fast_info
+        quote = {key: value for key in FAST_INFO_KEYS if (value := fast_info.get(key)) is not None}
+    except Exception:
+        _evict_ticker(symbol)
+        raise
+    if not quote:
+        # Failed read - don't serve "no price" for the TTL (same as get_ticker_info)
+        _evict_ticker(symbol)
+        return quote
+
+    with _FAST_INFO_CACHE_LOCK:
+        _cache_put(
+            _FAST_INFO_CACHE,
+            symbol,
+            quote,
+            FAST_INFO_CACHE_TTL_SECONDS,
+            FAST_INFO_CACHE_MAX_ENTRIES,
+        )
+    return quote
+
+
+def get_option_chain(symbol: str, expiration: str, ticker: Any = None) -> Any:  # noqa: ANN401
     """
-    end_date = datetime.now(ZoneInfo("America/New_York"))
+    Get ticker.option_chain(expiration), cached for OPTION_CHAIN_CACHE_TTL_SECONDS
+
+    In-process stand-in for an HTTP response cache (yfinance rejects caching sessions):
+    repeat options()/ticker() calls within the TTL reuse the parsed chain.
+    NaN volumes (illiquid strikes) are filled with 0 once, before caching;
+    the cached frames are shared - treat them as read-only.
+
+    Args:
+        symbol: Ticker symbol
+        expiration: Expiration date string from ticker.options
+        ticker: Existing yf.Ticker to fetch through on a miss (default: get_ticker)
+    """
+    key = (symbol, expiration)
+    now = time.monotonic()
+    with _OPTION_CHAIN_CACHE_LOCK:
+        entry = _OPTION_CHAIN_CACHE.get(key)
+    if entry is not None and now - entry[0] < OPTION_CHAIN_CACHE_TTL_SECONDS:
+        return entry[1]
+
+    chain = (ticker if ticker is not None else get_ticker(symbol)).option_chain(expiration)
+    chain.calls["volume"] = chain.calls["volume"].fillna(0)
+    chain.puts["volume"] = chain.puts["volume"].fillna(0)
+    with _OPTION_CHAIN_CACHE_LOCK:
+        _cache_put(
+            _OPTION_CHAIN_CACHE,
+            key,
+            chain,
+            OPTION_CHAIN_CACHE_TTL_SECONDS,
+            OPTION_CHAIN_CACHE_MAX_ENTRIES,
+        )
+    return chain
+
+
+@lru_cache(maxsize=64)
+def _date_range(months: int, today_ordinal: int) -> tuple[str, str]:
+    end_date = date.fromordinal(today_ordinal)
     # Minimal buffer: ~5 trading days per month are weekends/holidays
     # For 12 months: ~252 trading days = ~365 calendar days
     calendar_days = int(months * 30.5)  # Avg days per month
     start_date = end_date - timedelta(days=calendar_days)
 
     return (
-        start_date.strftime("%Y-%m-%d"),
-        end_date.strftime("%Y-%m-%d")
+        start_date.isoformat(),
+        end_date.isoformat()
     )
 
 
+def calculate_date_range(months: int) -> tuple[str, str]:
+    """
+    Calculate start/end dates for historical data fetch
+
+    Memoized per (months, ET date) - the strings only change once a day
+
+    Args:
+        months: Number of months of history (minimal buffer for weekends/holidays)
+
+    Returns:
+        Tuple of (start_date, end_date) as ISO strings
+    """
+    return _date_range(months, datetime.now(_ET).toordinal())
+
+
 def fetch_price_history(
     symbol: str,
     months: int = 12,
@@ -51,7 +280,7 @@ def fetch_price_history(
         DataFrame with OHLCV data, empty DataFrame on error
     """
     try:
-        ticker = yf.Ticker(symbol)
+        ticker = get_ticker(symbol)
         start_date, end_date = calculate_date_range(months)
 
         hist = ticker.history(
@@ -73,35 +302,63 @@ def fetch_multiple_histories(
     max_workers: int = 10
 ) -> dict[str, Any]:  # Returns dict[str, pd.DataFrame]
     """
-    Fetch historical data for multiple symbols in parallel
+    Fetch historical data for multiple symbols in one yf.download call
+
+    A single symbol goes straight through fetch_price_history (no batching to gain)
 
     Args:
         symbols: List of ticker symbols
         months: Number of months of history
         interval: Data interval
-        max_workers: Max concurrent API calls
+        max_workers: Max concurrent API calls (yf.download threads)
 
     Returns:
-        Dictionary mapping symbol -> DataFrame
+        Dictionary mapping symbol -> DataFrame (empty DataFrame if no data)
     """
-    results: dict[str, Any] = {}  # Dict[str, pd.DataFrame]
+    symbols = list(dict.fromkeys(symbols))
+    if len(symbols) == 1:
+        return {symbols[0]: fetch_price_history(symbols[0], months, interval)}
+
+    start_date, end_date = calculate_date_range(months)
+    frames = _download_frames(
+        symbols,
+        start=start_date,
+        end=end_date,
+        interval=interval,
+        threads=max_workers,
+        ignore_tz=False,  # Keep exchange-tz index, same as Ticker.history
+    )
+    return {symbol: frames.get(symbol, pd.DataFrame()) for symbol in symbols}
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all fetch jobs
-        future_to_symbol = {
-            executor.submit(fetch_price_history, symbol, months, interval): symbol
-            for symbol in symbols
-        }
-
-        # Collect results as they complete
-        for future in as_completed(future_to_symbol):
-            symbol = future_to_symbol[future]
-            try:
-                results[symbol] = future.result()
-            except Exception:
-                results[symbol] = pd.DataFrame()
 
-    return results
+@lru_cache(maxsize=8)
+def _cached_market_history(market_symbol: str, months: int, day: str) -> Any:  # noqa: ANN401, ARG001
+    hist = fetch_price_history(market_symbol, months)
+    if hist.empty:
+        msg = f"No history for {market_symbol}"
+        raise LookupError(msg)  # lru_cache does not cache exceptions - retry next call
+    return hist
+
+
+def fetch_market_history(
+    market_symbol: str = "^GSPC",
+    months: int = 12
+) -> Any:  # Returns pd.DataFrame  # noqa: ANN401
+    """
+    Fetch market index history, memoized per ET trading date
+
+    The date range ends at today (exclusive), so the result is fixed for the day:
+    every idio vol calculation shares one index fetch instead of one per symbol.
+    The returned DataFrame is shared - treat it as read-only.
+
+    Returns:
+        DataFrame with OHLCV data, empty DataFrame on error
+    """
+    day = datetime.now(_ET).date().isoformat()
+    try:
+        return _cached_market_history(market_symbol, months, day)
+    except LookupError:
+        return pd.DataFrame()
 
 
 def fetch_ticker_and_market(
@@ -112,6 +369,9 @@ def fetch_ticker_and_market(
     """
     Fetch ticker and market data in parallel (for factor analysis)
 
+    Market history comes from the per-day memo (fetch_market_history), so only
+    the first call of the day pays for the index download
+
     Args:
         symbol: Ticker symbol
         months: Number of months of history
@@ -120,12 +380,9 @@ def fetch_ticker_and_market(
     Returns:
         Tuple of (ticker_hist, market_hist) DataFrames
     """
-    histories = fetch_multiple_histories([symbol, market_symbol], months=months)
-
-    return (
-        histories.get(symbol, pd.DataFrame()),
-        histories.get(market_symbol, pd.DataFrame())
-    )
+    market_future = LOOKUP_EXECUTOR.submit(fetch_market_history, market_symbol, months)
+    ticker_hist = fetch_price_history(symbol, months)
+    return ticker_hist, market_future.result()
 
 
 def fetch_price_at_date(
@@ -145,7 +402,7 @@ def fetch_price_at_date(
         Price (float) or None if not available
     """
     try:
-        ticker = yf.Ticker(symbol)
+        ticker = get_ticker(symbol)
 
         # Fetch narrow window around target date
         start = (target_date - timedelta(days=window_days)).strftime("%Y-%m-%d")
@@ -156,17 +413,104 @@ def fetch_price_at_date(
         if hist.empty:
             return None
 
-        closes = hist["Close"].dropna()
-        if len(closes) == 0:
-            return None
+        return closest_price(hist["Close"], target_date, window_days)
 
-        # Find closest date to target (not just first in window)
-        target_ts = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        time_diffs = [(abs((idx - target_ts).total_seconds()), price)
-                     for idx, price in closes.items()]
-        _, closest_price = min(time_diffs, key=lambda x: x[0])
+    except Exception:
+        return None
 
-        return float(closest_price)
 
-    except Exception:
+def closest_price(
+    closes: Any,  # pd.Series of daily closes indexed by date  # noqa: ANN401
+    target_date: datetime,
+    window_days: int = 5
+) -> float | None:
+    """
+    Pick the close nearest to target_date from an already-fetched series
+
+    Args:
+        closes: Close price Series (DatetimeIndex, tz-aware or naive)
+        target_date: Target date for price lookup
+        window_days: Max distance in days from target (default 5)
+
+    Returns:
+        Price (float) or None if no close within window_days
+    """
+    closes = closes.dropna()
+    if len(closes) == 0:
         return None
+
+    # Find closest date to target (not just first in window)
+    target_ts = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
+    if getattr(closes.index, "tz", None) is None:
+        target_ts = target_ts.replace(tzinfo=None)  # yf.download daily index is tz-naive
+    # Vectorized: one timedelta64 array + argmin instead of a per-row Python loop
+    time_diffs = np.abs((closes.index - target_ts).to_numpy())
+    pos = int(time_diffs.argmin())
+
+    if time_diffs[pos] > np.timedelta64(window_days, "D"):
+        return None
+    return float(closes.iat[pos])
+
+
+def _download_frames(symbols: list[str], **params: Any) -> dict[str, Any]:  # noqa: ANN401
+    """
+    Run one yf.download for symbols and split it into per-symbol OHLCV frames
+
+    Returns:
+        Dictionary mapping symbol -> DataFrame (symbols without data omitted)
+    """
+    try:
+        hist_all = yf.download(
+            symbols,
+            group_by="ticker",
+            auto_adjust=True,
+            progress=False,
+            session=SESSION,
+            **params,
+        )
+    except Exception:
+        return {}
+
+    if hist_all is None or hist_all.empty:
+        return {}
+
+    # Single-symbol downloads come back with flat columns on older yfinance
+    multi_level = isinstance(hist_all.columns, pd.MultiIndex)
+
+    results: dict[str, Any] = {}  # Dict[str, pd.DataFrame]
+    for symbol in symbols:
+        try:
+            frame = hist_all[symbol.upper()] if multi_level else hist_all
+        except KeyError:
+            continue
+        frame = frame.dropna(how="all")
+        if not frame.empty:
+            results[symbol] = frame
+
+    return results
+
+
+def fetch_batch_closes(
+    symbols: list[str],
+    period: str = "1y"
+) -> dict[str, Any]:  # Returns dict[str, pd.Series]
+    """
+    Fetch daily closes for many symbols in a single yf.download call
+
+    Args:
+        symbols: List of ticker symbols
+        period: History period (default "1y")
+
+    Returns:
+        Dictionary mapping symbol -> Close Series (symbols without data omitted)
+    """
+    symbols = list(dict.fromkeys(symbols))  # yf.download collapses duplicates anyway
+    frames = _download_frames(symbols, period=period, interval="1d", threads=True)
+
+    results: dict[str, Any] = {}  # Dict[str, pd.Series]
+    for symbol, frame in frames.items():
+        closes = frame["Close"].dropna() if "Close" in frame else None
+        if closes is not None and not closes.empty:
+            results[symbol] = closes
+
+    return results
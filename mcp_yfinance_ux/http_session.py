@@ -0,0 +1,44 @@
+"""
+Shared HTTP session for all yfinance calls - connection pooling
+Reuses TCP+TLS handshakes to query1/query2.finance.yahoo.com across yf.Ticker instances
+"""
+
+from typing import Any
+
+# Pool sized above our worker pools (historical.FANOUT_EXECUTOR + LOOKUP_EXECUTOR)
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.2
+
+
+def _build_session() -> Any:  # noqa: ANN401
+    """
+    Build one process-wide session.
+
+    Prefers curl_cffi (browser TLS impersonation survives Yahoo's anti-bot checks),
+    falls back to requests.Session with a pooled, retrying HTTPAdapter.
+    """
+    try:
+        from curl_cffi import requests as curl_requests  # noqa: PLC0415
+
+        return curl_requests.Session(impersonate="chrome")
+    except ImportError:
+        pass
+
+    import requests  # noqa: PLC0415
+    from requests.adapters import HTTPAdapter  # noqa: PLC0415
+    from urllib3.util.retry import Retry  # noqa: PLC0415
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(total=MAX_RETRIES, backoff_factor=RETRY_BACKOFF),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Pass to every yf.Ticker / yf.download: yf.Ticker(symbol, session=SESSION)
+SESSION = _build_session()
@@ -3,15 +3,37 @@ Core market data functionality - yfinance business logic
 Testable independently of MCP protocol layer
 """
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import math
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
 from datetime import datetime, timedelta
-from typing import Any
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, TypeVar
 from zoneinfo import ZoneInfo
 
 import numpy as np
-import yfinance as yf  # type: ignore[import-untyped]
-
-from mcp_yfinance_ux.historical import fetch_price_at_date, fetch_ticker_and_market
+from numpy.lib.stride_tricks import sliding_window_view
+
+from mcp_yfinance_ux.historical import (
+    FANOUT_EXECUTOR,
+    LOOKUP_EXECUTOR,
+    closest_price,
+    fetch_batch_closes,
+    fetch_market_history,
+    fetch_price_at_date,
+    fetch_price_history,
+    get_fast_info,
+    get_option_chain,
+    get_ticker,
+    get_ticker_info,
+)
 
 # Constants
 WEEKEND_START_DAY = 5  # Saturday (Monday = 0, Sunday = 6)
@@ -20,6 +42,10 @@ SATURDAY = 5  # Saturday weekday number
 SUNDAY = 6  # Sunday weekday number
 TRADING_DAYS_PER_MONTH = 21  # Approximate trading days in 1 month
 MIN_HISTORY_LEN = 2  # Minimum data points needed for calculations
+MIN_IDIO_HISTORY_LEN = 30  # Minimum daily returns for beta/idio vol regression
+TRADING_DAYS_PER_YEAR = 252  # Annualization factor for daily volatility
+ANNUALIZED_VOL_PCT = math.sqrt(TRADING_DAYS_PER_YEAR) * 100  # Daily std -> annualized %
+MIN_MARKET_RETURN_VAR = 1e-14  # Below this, market returns are flat - beta undefined
 
 # Factor thresholds
 RSI_PERIOD = 14
@@ -30,7 +56,126 @@ BETA_LOW_THRESHOLD = 0.8
 IDIO_VOL_HIGH_THRESHOLD = 30
 IDIO_VOL_LOW_THRESHOLD = 15
 
+# Request coalescing: concurrent callers for the same (operation, key) share one fetch
+T = TypeVar("T")
+
+# Only fetches still in flight live here - the owner pops its key on completion
+_INFLIGHT: dict[tuple[str, str], Future[Any]] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _coalesce(key: tuple[str, str], fetch: Callable[[], T]) -> T:
+    """
+    Run fetch() once for all concurrent callers with the same key.
+
+    The first caller becomes the owner and performs the fetch; everyone arriving
+    while it is in flight waits on the same Future instead of issuing another
+    Yahoo request. The key is removed as soon as the fetch finishes, so the map
+    never holds completed results.
+    """
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        owner = future is None
+        if future is None:
+            future = _INFLIGHT[key] = Future()
+
+    if not owner:
+        return future.result()  # type: ignore[no-any-return]
+
+    try:
+        result = fetch()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+
+
+# Per-symbol TTL caches for derived factor data (stable over minutes within a session)
+MOMENTUM_CACHE_TTL_SECONDS = 300.0
+IDIO_VOL_CACHE_TTL_SECONDS = 900.0
+FACTOR_CACHE_MAX_ENTRIES = 1024  # Per cached function; least recently used evicted first
+
+
+class _SymbolTTLCache:
+    """
+    Thread-safe per-symbol TTL + LRU cache around a symbol -> dict[str, float | None] function.
 
+    Keyed by (symbol, source): calls passing pre-fetched closes (the first argument
+    after symbol, or closes=) are cached apart from calls that fetch live, since the
+    two can differ (e.g. momentum's current price is the last daily close vs the live
+    quote). Other arguments (target_dates, market_closes) don't change the source.
+
+    Results where every value is None (fetch failed) are not cached, so transient
+    Yahoo errors don't stick for the whole TTL.
+    """
+
+    def __init__(
+        self,
+        func: Callable[..., dict[str, float | None]],
+        ttl_seconds: float,
+        max_entries: int = FACTOR_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self._func = func
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._cache: OrderedDict[tuple[str, bool], tuple[float, dict[str, float | None]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.__doc__ = func.__doc__
+        self.__name__ = func.__name__
+
+    def __call__(
+        self, symbol: str, *args: Any, **kwargs: Any  # noqa: ANN401
+    ) -> dict[str, float | None]:
+        closes = args[0] if args else kwargs.get("closes")
+        key = (symbol, closes is not None)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and now - entry[0] < self._ttl:
+                self._cache.move_to_end(key)
+                return dict(entry[1])
+
+        value = self._func(symbol, *args, **kwargs)
+        if any(v is not None for v in value.values()):
+            with self._lock:
+                self._cache[key] = (time.monotonic(), value)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self._max_entries:
+                    self._cache.popitem(last=False)
+        return dict(value)
+
+    def cache_clear(self) -> None:
+        """Drop all cached entries (for tests)"""
+        with self._lock:
+            self._cache.clear()
+
+
+def ttl_cache(
+    ttl_seconds: float,
+    max_entries: int = FACTOR_CACHE_MAX_ENTRIES,
+) -> Callable[[Callable[..., dict[str, float | None]]], _SymbolTTLCache]:
+    """Decorator: cache a per-symbol factor calculation for ttl_seconds (LRU-bounded)"""
+    def decorator(func: Callable[..., dict[str, float | None]]) -> _SymbolTTLCache:
+        return _SymbolTTLCache(func, ttl_seconds, max_entries)
+    return decorator
+
+
+# Well-formed Yahoo symbol: AAPL, BRK.B, ^GSPC, ES=F, EURUSD=X, 000001.SS, BTC-USD, M&M.NS
+# Length cap is generous - it only rejects garbage, never a real listing
+_SYMBOL_RE = re.compile(r"^[\^A-Z0-9][A-Z0-9.\-=&]{0,31}$", re.IGNORECASE)
+# Exactly one dot, suffix of 2+ chars with no lowercase and at least one uppercase letter
+_EXCHANGE_SUFFIX_RE = re.compile(r"^[^.]*\.(?=[^a-z.]*[A-Z])[^a-z.]{2,}$")
+_SLASH_TO_DASH = str.maketrans("/", "-")
+
+
+@lru_cache(maxsize=2048)
 def normalize_ticker_symbol(symbol: str) -> str:
     """
     Normalize ticker symbol to Yahoo Finance format.
@@ -49,50 +194,47 @@ def normalize_ticker_symbol(symbol: str) -> str:
     Heuristic:
     - If dot followed by 2+ uppercase chars: exchange suffix (keep dot)
     - If dot followed by 1-2 chars at end: share class (replace with dash)
+
+    Raises ValueError for malformed symbols (before any network call is made)
+    Results are memoized - the same symbols recur across screens and batches
     """
     # Replace slashes with hyphens first
-    symbol = symbol.replace("/", "-")
+    symbol = symbol.strip().translate(_SLASH_TO_DASH)
+    if not _SYMBOL_RE.match(symbol):
+        msg = f"Invalid symbol: {symbol!r}"
+        raise ValueError(msg)
 
-    # Check if this is an exchange suffix (dot followed by 2+ uppercase chars)
+    # Exchange suffix (dot followed by 2+ uppercase chars) - keep the dot
     # Common exchange suffixes: .TO, .HK, .L, .AX, .PA, .DE, .SW, etc.
-    if "." in symbol:
-        parts = symbol.split(".")
-        # Exchange suffixes are exactly 2 parts, with suffix being 2+ uppercase chars
-        if (
-            len(parts) == 2  # noqa: PLR2004
-            and len(parts[1]) >= 2  # noqa: PLR2004
-            and parts[1].isupper()
-        ):
-            # Exchange suffix - keep the dot
-            return symbol
-        # Share class - replace dot with dash
-        return symbol.replace(".", "-")
+    if _EXCHANGE_SUFFIX_RE.match(symbol):
+        return symbol
 
-    return symbol
+    # Share class - replace dot with dash (no-op without a dot)
+    return symbol.replace(".", "-")
 
 # Category to symbol mappings (for get_market_snapshot)
 # Aligned with Paleologo factor framework
-CATEGORY_MAPPING: dict[str, list[str]] = {
-    "us": ["sp500", "nasdaq", "dow", "russell2000"],
-    "futures": ["es_futures", "nq_futures", "ym_futures"],
-    "volatility": ["vix"],
-    "commodities": ["gold", "oil_wti", "natgas"],
-    "rates": ["us10y"],
-    "crypto": ["btc", "eth", "sol"],
-    "europe": ["stoxx50", "dax", "ftse", "cac40"],
-    "asia": ["nikkei", "hangseng", "shanghai"],
-    "currencies": ["eurusd", "usdjpy", "usdcny", "gbpusd", "usdcad", "audusd"],
-    "bonds": ["us10y", "us2y", "us30y"],
+CATEGORY_MAPPING: MappingProxyType[str, tuple[str, ...]] = MappingProxyType({
+    "us": ("sp500", "nasdaq", "dow", "russell2000"),
+    "futures": ("es_futures", "nq_futures", "ym_futures"),
+    "volatility": ("vix",),
+    "commodities": ("gold", "oil_wti", "natgas"),
+    "rates": ("us10y",),
+    "crypto": ("btc", "eth", "sol"),
+    "europe": ("stoxx50", "dax", "ftse", "cac40"),
+    "asia": ("nikkei", "hangseng", "shanghai"),
+    "currencies": ("eurusd", "usdjpy", "usdcny", "gbpusd", "usdcad", "audusd"),
+    "bonds": ("us10y", "us2y", "us30y"),
     # Industry factors (GICS sectors)
-    "sectors": [
+    "sectors": (
         "tech", "financials", "healthcare", "energy", "consumer_disc",
-        "industrials", "materials", "utilities", "consumer_stpl", "real_estate", "communication"
-    ],
+        "industrials", "materials", "utilities", "consumer_stpl", "real_estate", "communication",
+    ),
     # Style factors
-    "styles": ["momentum", "value", "growth", "quality", "small_cap"],
+    "styles": ("momentum", "value", "growth", "quality", "small_cap"),
     # Convenience aggregates
-    "factors": ["vix", "gold", "oil_wti", "natgas", "us10y"],  # Core systematic factors
-    "all": [
+    "factors": ("vix", "gold", "oil_wti", "natgas", "us10y"),  # Core systematic factors
+    "all": (
         "es_futures", "nq_futures", "ym_futures",
         "vix", "gold", "oil_wti", "natgas", "us10y",
         "sp500", "nasdaq", "dow", "russell2000",
@@ -103,11 +245,11 @@ CATEGORY_MAPPING: dict[str, list[str]] = {
         "tech", "financials", "healthcare", "energy", "consumer_disc",
         "industrials", "materials", "utilities", "consumer_stpl", "real_estate", "communication",
         "momentum", "value", "growth", "quality", "small_cap",
-    ],
-}
+    ),
+})
 
 # Market snapshot symbol mappings
-MARKET_SYMBOLS = {
+MARKET_SYMBOLS: MappingProxyType[str, str] = MappingProxyType({
     # US Indices
     "sp500": "^GSPC",
     "nasdaq": "^IXIC",
@@ -188,37 +330,57 @@ MARKET_SYMBOLS = {
 
     # Private Credit / BDCs
     "private_credit": "BIZD",  # VanEck BDC Income ETF (private credit proxy)
-}
+})
+
+# Every snapshot token -> (key, symbol) pairs it expands to (categories win over symbol keys)
+# Precomputed so get_market_snapshot is a flat concat of ready-made pairs per request
+SYMBOLS_BY_CATEGORY: MappingProxyType[str, tuple[tuple[str, str], ...]] = MappingProxyType({
+    **{key: ((key, symbol),) for key, symbol in MARKET_SYMBOLS.items()},
+    **{
+        category: tuple((key, MARKET_SYMBOLS[key]) for key in keys if key in MARKET_SYMBOLS)
+        for category, keys in CATEGORY_MAPPING.items()
+    },
+})
+
+# Default snapshot categories (market hours decide cash indices vs futures)
+DEFAULT_CATEGORIES_MARKET_OPEN: tuple[str, ...] = (
+    "us", "volatility", "commodities", "rates", "sectors", "styles",
+    "crypto", "europe", "asia", "currencies",
+)
+DEFAULT_CATEGORIES_MARKET_CLOSED: tuple[str, ...] = (
+    "futures", "volatility", "commodities", "rates", "sectors", "styles",
+    "crypto", "europe", "asia", "currencies",
+)
 
 # Formatting sections (for format_market_snapshot)
 # Organized by Paleologo factor framework
-FORMATTING_SECTIONS: dict[str, list[str]] = {
-    "MARKET": ["sp500", "nasdaq", "dow", "russell2000"],  # During market hours
-    "MARKET FUTURES": ["es_futures", "nq_futures", "ym_futures"],  # After hours
-    "VOLATILITY": ["vix"],
-    "COMMODITIES": ["gold", "oil_wti", "natgas"],
-    "RATES": ["us10y"],
-    "SECTORS": [
+FORMATTING_SECTIONS: MappingProxyType[str, tuple[str, ...]] = MappingProxyType({
+    "MARKET": ("sp500", "nasdaq", "dow", "russell2000"),  # During market hours
+    "MARKET FUTURES": ("es_futures", "nq_futures", "ym_futures"),  # After hours
+    "VOLATILITY": ("vix",),
+    "COMMODITIES": ("gold", "oil_wti", "natgas"),
+    "RATES": ("us10y",),
+    "SECTORS": (
         "tech", "financials", "healthcare", "energy", "consumer_disc",
-        "industrials", "materials", "utilities", "consumer_stpl", "real_estate", "communication"
-    ],
-    "STYLE FACTORS": ["momentum", "value", "growth", "quality", "small_cap"],
-    "CRYPTO": ["btc", "eth", "sol"],
-    "EUROPE": ["stoxx50", "dax", "ftse", "cac40"],
-    "ASIA": ["nikkei", "hangseng", "shanghai"],
-    "CURRENCIES": ["eurusd", "usdjpy", "usdcny", "gbpusd", "usdcad", "audusd"],
-}
+        "industrials", "materials", "utilities", "consumer_stpl", "real_estate", "communication",
+    ),
+    "STYLE FACTORS": ("momentum", "value", "growth", "quality", "small_cap"),
+    "CRYPTO": ("btc", "eth", "sol"),
+    "EUROPE": ("stoxx50", "dax", "ftse", "cac40"),
+    "ASIA": ("nikkei", "hangseng", "shanghai"),
+    "CURRENCIES": ("eurusd", "usdjpy", "usdcny", "gbpusd", "usdcad", "audusd"),
+})
 
 # Section to region mapping (for market status display)
-SECTION_REGION_MAP: dict[str, str] = {
+SECTION_REGION_MAP: MappingProxyType[str, str] = MappingProxyType({
     "MARKET": "us",
     "MARKET FUTURES": "us",
     "EUROPE": "europe",
     "ASIA": "asia",
-}
+})
 
 # Friendly display names
-DISPLAY_NAMES: dict[str, str] = {
+DISPLAY_NAMES: MappingProxyType[str, str] = MappingProxyType({
     "es_futures": "S&P 500", "nq_futures": "Nasdaq", "ym_futures": "Dow",
     "gold": "Gold", "btc": "Bitcoin", "vix": "VIX",
     "oil_wti": "Oil WTI", "natgas": "Nat Gas",
@@ -242,30 +404,61 @@ DISPLAY_NAMES: dict[str, str] = {
     "quality": "Quality", "small_cap": "Small Cap",
     # Private credit
     "private_credit": "Private Credit",
-}
+})
 
 # Factor annotations
-FACTOR_ANNOTATIONS: dict[str, str] = {
+FACTOR_ANNOTATIONS: MappingProxyType[str, str] = MappingProxyType({
     "gold": "Safe haven",
     "btc": "Risk-on",
     "vix": "Fear gauge",
     "us10y": "Fed policy",
-}
+})
+
+
+# Exchange time zones (resolved once at import)
+_ET = ZoneInfo("America/New_York")
+_CET = ZoneInfo("Europe/Paris")
+_JST = ZoneInfo("Asia/Tokyo")
+
+# Trading session bounds as minutes since local midnight
+US_MARKET_OPEN_MINUTE = 9 * 60 + 30  # 9:30 AM ET
+US_MARKET_CLOSE_MINUTE = 16 * 60  # 4:00 PM ET
+EUROPE_MARKET_OPEN_MINUTE = 9 * 60  # 9:00 AM CET
+EUROPE_MARKET_CLOSE_MINUTE = 17 * 60 + 30  # 5:30 PM CET
+ASIA_MARKET_OPEN_MINUTE = 9 * 60  # 9:00 AM JST
+ASIA_MARKET_CLOSE_MINUTE = 15 * 60  # 3:00 PM JST
+FUTURES_MAINTENANCE_START_MINUTE = 17 * 60  # 5:00 PM ET
+FUTURES_MAINTENANCE_END_MINUTE = 18 * 60  # 6:00 PM ET
+
+# Last is_market_open() result keyed by wall-clock minute (open/close fall on minute bounds)
+_market_open_cache: tuple[int, bool] = (-1, False)
+
+
+def _minute_of_day(now: datetime) -> int:
+    """Minutes since local midnight"""
+    return now.hour * 60 + now.minute
 
 
 def is_market_open() -> bool:
     """Check if US market is currently open (9:30 AM - 4:00 PM ET, Mon-Fri)"""
-    now_et = datetime.now(ZoneInfo("America/New_York"))
+    global _market_open_cache  # noqa: PLW0603
 
-    # Check if weekend
-    if now_et.weekday() >= WEEKEND_START_DAY:
-        return False
+    minute_bucket = int(time.time() // 60)
+    cached_bucket, cached_is_open = _market_open_cache
+    if cached_bucket == minute_bucket:
+        return cached_is_open
 
-    # Check if within market hours (9:30 AM - 4:00 PM ET)
-    market_open = now_et.replace(hour=9, minute=30, second=0, microsecond=0)
-    market_close = now_et.replace(hour=16, minute=0, second=0, microsecond=0)
+    now_et = datetime.now(_ET)
 
-    return market_open <= now_et < market_close
+    # Weekend, or outside market hours (9:30 AM - 4:00 PM ET)
+    minute = _minute_of_day(now_et)
+    is_open = (
+        now_et.weekday() < WEEKEND_START_DAY
+        and US_MARKET_OPEN_MINUTE <= minute < US_MARKET_CLOSE_MINUTE
+    )
+
+    _market_open_cache = (minute_bucket, is_open)
+    return is_open
 
 
 def is_us_market_open() -> bool:
@@ -275,32 +468,28 @@ def is_us_market_open() -> bool:
 
 def is_europe_market_open() -> bool:
     """Check if European markets are open (9:00 AM - 5:30 PM CET, Mon-Fri)"""
-    now_cet = datetime.now(ZoneInfo("Europe/Paris"))
+    now_cet = datetime.now(_CET)
 
     # Check if weekend
     if now_cet.weekday() >= WEEKEND_START_DAY:
         return False
 
     # Check if within market hours (9:00 AM - 5:30 PM CET)
-    market_open = now_cet.replace(hour=9, minute=0, second=0, microsecond=0)
-    market_close = now_cet.replace(hour=17, minute=30, second=0, microsecond=0)
-
-    return market_open <= now_cet < market_close
+    minute = _minute_of_day(now_cet)
+    return EUROPE_MARKET_OPEN_MINUTE <= minute < EUROPE_MARKET_CLOSE_MINUTE
 
 
 def is_asia_market_open() -> bool:
     """Check if Asian markets are open (9:00 AM - 3:00 PM JST for Tokyo, Mon-Fri)"""
-    now_jst = datetime.now(ZoneInfo("Asia/Tokyo"))
+    now_jst = datetime.now(_JST)
 
     # Check if weekend
     if now_jst.weekday() >= WEEKEND_START_DAY:
         return False
 
     # Check if within market hours (9:00 AM - 3:00 PM JST)
-    market_open = now_jst.replace(hour=9, minute=0, second=0, microsecond=0)
-    market_close = now_jst.replace(hour=15, minute=0, second=0, microsecond=0)
-
-    return market_open <= now_jst < market_close
+    minute = _minute_of_day(now_jst)
+    return ASIA_MARKET_OPEN_MINUTE <= minute < ASIA_MARKET_CLOSE_MINUTE
 
 
 def is_futures_open() -> bool:
@@ -310,28 +499,24 @@ def is_futures_open() -> bool:
     - Sunday 6:00 PM ET through Friday 5:00 PM ET
     - Daily maintenance: 5:00 PM - 6:00 PM ET
     """
-    now_et = datetime.now(ZoneInfo("America/New_York"))
+    now_et = datetime.now(_ET)
+    weekday = now_et.weekday()
+    minute = _minute_of_day(now_et)
 
     # Friday after 5:00 PM ET - closed until Sunday 6:00 PM ET
-    if now_et.weekday() == FRIDAY:
-        close_time = now_et.replace(hour=17, minute=0, second=0, microsecond=0)
-        if now_et >= close_time:
-            return False
+    if weekday == FRIDAY and minute >= FUTURES_MAINTENANCE_START_MINUTE:
+        return False
 
     # Saturday - closed all day
-    if now_et.weekday() == SATURDAY:
+    if weekday == SATURDAY:
         return False
 
     # Sunday before 6:00 PM ET - closed
-    if now_et.weekday() == SUNDAY:
-        open_time = now_et.replace(hour=18, minute=0, second=0, microsecond=0)
-        if now_et < open_time:
-            return False
+    if weekday == SUNDAY and minute < FUTURES_MAINTENANCE_END_MINUTE:
+        return False
 
     # Daily maintenance window: 5:00 PM - 6:00 PM ET (not during maintenance)
-    maintenance_start = now_et.replace(hour=17, minute=0, second=0, microsecond=0)
-    maintenance_end = now_et.replace(hour=18, minute=0, second=0, microsecond=0)
-    return not (maintenance_start <= now_et < maintenance_end)
+    return not (FUTURES_MAINTENANCE_START_MINUTE <= minute < FUTURES_MAINTENANCE_END_MINUTE)
 
 
 def get_market_status(region: str) -> str:
@@ -349,31 +534,57 @@ def get_market_status(region: str) -> str:
     return ""
 
 
-def calculate_momentum(symbol: str) -> dict[str, float | None]:
+def momentum_target_dates() -> tuple[datetime, datetime, datetime]:
+    """Lookback dates for momentum: (1 week, 1 month, 1 year ago) in ET"""
+    now = datetime.now(_ET)
+    return (
+        now - timedelta(days=7),
+        now - timedelta(days=30),
+        now - timedelta(days=365),
+    )
+
+
+@ttl_cache(MOMENTUM_CACHE_TTL_SECONDS)
+def calculate_momentum(
+    symbol: str,
+    closes: Any = None,  # noqa: ANN401
+    target_dates: tuple[datetime, datetime, datetime] | None = None,
+) -> dict[str, float | None]:
     """
     Calculate trailing returns (1W, 1M, 1Y) for momentum analysis
 
     Uses fast_info for current price + narrow window fetches for precise lookback dates
-    Fetches ~22 days total vs 252 days (91% reduction)
+    Fetches ~22 days total vs 252 days (91% reduction); the three window fetches run
+    concurrently
+
+    If closes (1Y daily Close series, e.g. from fetch_batch_closes) is given,
+    everything is sliced from it instead - zero extra HTTP calls.
+    Batch callers pass target_dates (momentum_target_dates()) computed once per batch.
     """
     try:
-        ticker = yf.Ticker(symbol)
+        if target_dates is None:
+            target_dates = momentum_target_dates()
 
-        # Get current price from fast_info (no fetch!)
-        current_price = ticker.fast_info.get("lastPrice")
-        if current_price is None:
-            return {"momentum_1w": None, "momentum_1m": None, "momentum_1y": None}
+        if closes is not None:
+            closes = closes.dropna()
+            if len(closes) == 0:
+                return {"momentum_1w": None, "momentum_1m": None, "momentum_1y": None}
+            current_price = float(closes.iloc[-1])
 
-        # Calculate target dates for precise lookback
-        now = datetime.now(ZoneInfo("America/New_York"))
-        date_1y_ago = now - timedelta(days=365)
-        date_1m_ago = now - timedelta(days=30)
-        date_1w_ago = now - timedelta(days=7)
-
-        # Fetch prices at specific dates (narrow windows, ~7-8 days each)
-        price_1y_ago = fetch_price_at_date(symbol, date_1y_ago)
-        price_1m_ago = fetch_price_at_date(symbol, date_1m_ago)
-        price_1w_ago = fetch_price_at_date(symbol, date_1w_ago)
+            price_1w_ago, price_1m_ago, price_1y_ago = (
+                closest_price(closes, target) for target in target_dates
+            )
+        else:
+            # Get current price from the short-TTL fast_info cache
+            last_price = get_fast_info(symbol).get("lastPrice")
+            if last_price is None:
+                return {"momentum_1w": None, "momentum_1m": None, "momentum_1y": None}
+            current_price = last_price
+
+            # Fetch prices at specific dates (narrow windows, ~7-8 days each) in parallel
+            price_1w_ago, price_1m_ago, price_1y_ago = LOOKUP_EXECUTOR.map(
+                lambda target: fetch_price_at_date(symbol, target), target_dates
+            )
 
         # Calculate momentum
         momentum_1y = (
@@ -398,66 +609,138 @@ def calculate_momentum(symbol: str) -> dict[str, float | None]:
         return {"momentum_1w": None, "momentum_1m": None, "momentum_1y": None}
 
 
+def _wilder_smooth_last(values: Any, period: int) -> Any:  # noqa: ANN401
+    """
+    Final value of Wilder's smoothing: SMA seed, then (prev * (N-1) + cur) / N
+
+    The recurrence is a linear filter, so it unrolls to closed form
+    seed * d^m + (1/N) * sum(d^(m-1-i) * x_i) with d = (N-1)/N -
+    one dot product instead of a sequential Python loop.
+    Smooths along the last axis, so stacked rows share one weight vector
+    """
+    decay = (period - 1) / period
+    tail = values[..., period:]
+    weights = decay ** np.arange(tail.shape[-1] - 1, -1, -1, dtype=np.float64)
+    return values[..., :period].mean(axis=-1) * decay ** tail.shape[-1] + (tail @ weights) / period
+
+
 def calculate_rsi(prices: Any, period: int = RSI_PERIOD) -> float | None:  # noqa: ANN401
-    """Calculate RSI (Relative Strength Index) for a price series"""
+    """
+    Calculate RSI (Relative Strength Index) with Wilder's smoothing
+
+    Performance: converts the Series to a float64 ndarray once and works in numpy
+    (pandas Series overhead dominates on ~22-row windows). Gains and losses are
+    smoothed together as one 2-row array, sharing the decay weights
+    """
     try:
-        # Calculate price changes
-        delta = prices.diff()
+        closes = np.asarray(prices, dtype=np.float64)
+        closes = closes[~np.isnan(closes)]
+        if len(closes) <= period:
+            return None
 
-        # Separate gains and losses
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
+        # Price changes split into gains (row 0) and losses (row 1), Wilder-smoothed
+        # Branchless: |d| + d = 2 * gain, |d| - d = 2 * loss (exact in floating point);
+        # the common factor 2 cancels in gain / loss, so it is never divided out
+        delta = np.diff(closes)
+        abs_delta = np.abs(delta)
+        moves = np.stack((abs_delta + delta, abs_delta - delta))
+        avg_gain, avg_loss = _wilder_smooth_last(moves, period)
 
-        # Calculate average gains and losses
-        avg_gain = gain.rolling(window=period).mean()
-        avg_loss = loss.rolling(window=period).mean()
+        if avg_loss == 0:
+            return 100.0 if avg_gain > 0 else None
 
-        # Calculate RS and RSI
         rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-
-        # Return most recent RSI value
-        return float(rsi.iloc[-1]) if not np.isnan(rsi.iloc[-1]) else None
+        return float(100 - (100 / (1 + rs)))
     except Exception:
         return None
 
 
-def calculate_idio_vol(symbol: str) -> dict[str, float | None]:
-    """Calculate idiosyncratic volatility (stock-specific risk after removing market exposure)"""
-    try:
-        # Fetch ticker and market data in parallel (12 months)
-        hist_ticker, hist_market = fetch_ticker_and_market(symbol, months=12)
+def _daily_returns(closes: Any) -> tuple[Any, Any]:  # noqa: ANN401
+    """
+    Simple daily returns of a Close series as (returns, int64 UTC-ns dates)
 
-        min_history_len = 30
-        if hist_ticker.empty or hist_market.empty:
-            return {"idio_vol": None, "total_vol": None}
+    Same rows as closes.pct_change().dropna(): a NaN close drops the returns on both sides
+    """
+    prices = closes.to_numpy(dtype=np.float64)
+    returns = prices[1:] / prices[:-1] - 1
+    dates = closes.index.as_unit("ns").asi8[1:]  # Same unit for every series
+    valid = ~np.isnan(returns)
+    return returns[valid], dates[valid]
 
-        if len(hist_ticker) < min_history_len or len(hist_market) < min_history_len:
+
+def market_daily_returns(months: int = 12) -> tuple[Any, Any] | None:
+    """
+    S&P 500 daily (returns, dates) for idio vol
+
+    The index history comes from fetch_market_history's per-day memo, so every
+    single-symbol idio vol call shares one ^GSPC fetch; deriving the return arrays
+    from it is cheap. Returns None if the index history is unavailable.
+    """
+    hist = fetch_market_history(MARKET_SYMBOLS["sp500"], months)
+    if len(hist) < MIN_IDIO_HISTORY_LEN:
+        return None
+    return _daily_returns(hist["Close"])
+
+
+@ttl_cache(IDIO_VOL_CACHE_TTL_SECONDS)
+def calculate_idio_vol(
+    symbol: str,
+    closes: Any = None,  # noqa: ANN401
+    market_closes: Any = None,  # noqa: ANN401
+) -> dict[str, float | None]:
+    """
+    Calculate idiosyncratic volatility (stock-specific risk after removing market exposure)
+
+    If closes and market_closes (1Y daily Close series) are given, no history is fetched
+    """
+    try:
+        if closes is None or market_closes is None:
+            # Fetch ticker history (12 months) while the per-day market returns resolve
+            market_future = LOOKUP_EXECUTOR.submit(market_daily_returns, 12)
+            hist_ticker = fetch_price_history(symbol, months=12)
+            market = market_future.result()
+            if hist_ticker.empty or market is None:
+                return {"idio_vol": None, "total_vol": None}
+            closes = hist_ticker["Close"]
+        else:
+            market = _daily_returns(market_closes)
+
+        # Short market history is caught by the aligned-length check below
+        if len(closes) < MIN_IDIO_HISTORY_LEN:
             return {"idio_vol": None, "total_vol": None}
 
-        # Calculate daily returns
-        ticker_returns = hist_ticker["Close"].pct_change().dropna()
-        market_returns = hist_market["Close"].pct_change().dropna()
+        # Daily returns and date alignment in plain numpy (no pandas Series round-trips)
+        y, y_dates = _daily_returns(closes)
+        x, x_dates = market
 
         # Align dates (intersection)
-        common_dates = ticker_returns.index.intersection(market_returns.index)
-        ticker_returns = ticker_returns.loc[common_dates]
-        market_returns = market_returns.loc[common_dates]
+        _, y_pos, x_pos = np.intersect1d(y_dates, x_dates, assume_unique=True, return_indices=True)
+        y = y[y_pos]
+        x = x[x_pos]
 
-        if len(ticker_returns) < min_history_len:
+        if len(y) < MIN_IDIO_HISTORY_LEN:
             return {"idio_vol": None, "total_vol": None}
 
-        # Total volatility (annualized)
-        total_vol = float(ticker_returns.std() * np.sqrt(252) * 100)  # Convert to percentage
+        # Closed-form univariate OLS on the return moments (what polyfit's SVD reduces to):
+        # beta = cov(x, y) / var(x), residual variance = var(y) - beta * cov(x, y)
+        x = x - x.mean()
+        y = y - y.mean()
+        ss_x = x @ x  # n * var(x)
+        ss_y = y @ y  # n * var(y)
 
-        # Linear regression: decompose returns into market (beta) and stock-specific (alpha)
-        beta, alpha = np.polyfit(market_returns, ticker_returns, 1)
+        # Annualized sample std (ddof=1, as pandas .std())
+        dof = len(y) - 1
+        total_vol = math.sqrt(ss_y / dof) * ANNUALIZED_VOL_PCT
 
-        # Residuals = idiosyncratic component (stock-specific risk)
-        residuals = ticker_returns - (alpha + beta * market_returns)
+        # Flat market returns: beta is undefined (the fit would blow up), so no idio vol
+        if ss_x < MIN_MARKET_RETURN_VAR * len(x):
+            return {"idio_vol": None, "total_vol": total_vol}
 
-        # Idiosyncratic volatility (annualized)
-        idio_vol = float(residuals.std() * np.sqrt(252) * 100)  # Convert to percentage
+        # Residuals of a fit with an intercept have zero mean, so their sum of
+        # squares is ss_residual
+        sp_xy = x @ y  # n * cov(x, y)
+        ss_residual = max(ss_y - sp_xy * sp_xy / ss_x, 0.0)
+        idio_vol = math.sqrt(ss_residual / dof) * ANNUALIZED_VOL_PCT
 
         return {
             "idio_vol": idio_vol,
@@ -467,11 +750,88 @@ def calculate_idio_vol(symbol: str) -> dict[str, float | None]:
         return {"idio_vol": None, "total_vol": None}
 
 
+def calculate_idio_vol_batch(
+    symbols: list[str],
+    closes_by_symbol: dict[str, Any] | None = None,
+) -> dict[str, dict[str, float | None]]:
+    """
+    Calculate idio vol for many symbols with a single least-squares solve
+
+    Stacks daily returns into R (T x N) and regresses on X = [1, market] with one
+    np.linalg.lstsq call instead of N separate fits. Symbols whose history has gaps
+    on market dates fall back to the per-symbol calculation (own date intersection).
+
+    Args:
+        symbols: Ticker symbols
+        closes_by_symbol: Pre-fetched 1Y closes (from fetch_batch_closes), must include
+            the market index; fetched when omitted
+
+    Returns:
+        Dictionary mapping symbol -> {"idio_vol", "total_vol"} (only symbols with results)
+    """
+    market_symbol = MARKET_SYMBOLS["sp500"]
+    if closes_by_symbol is None:
+        closes_by_symbol = fetch_batch_closes([*symbols, market_symbol])
+
+    market_closes = closes_by_symbol.get(market_symbol)
+    if market_closes is None or len(market_closes) < MIN_IDIO_HISTORY_LEN:
+        return {}
+    market_returns = market_closes.pct_change().dropna()
+
+    results: dict[str, dict[str, float | None]] = {}
+    stacked_returns = []
+    stacked_symbols = []
+    for symbol in dict.fromkeys(symbols):
+        closes = closes_by_symbol.get(symbol)
+        if closes is None or len(closes) < MIN_IDIO_HISTORY_LEN:
+            continue
+
+        returns = closes.pct_change().reindex(market_returns.index)
+        if returns.isna().any():
+            # Different trading calendar - regress on this symbol's own date intersection
+            results[symbol] = calculate_idio_vol(symbol, closes, market_closes)
+            continue
+
+        stacked_returns.append(returns.to_numpy(dtype=np.float64))
+        stacked_symbols.append(symbol)
+
+    if stacked_symbols and len(market_returns) >= MIN_IDIO_HISTORY_LEN:
+        r = np.column_stack(stacked_returns)  # (T, N)
+        market = market_returns.to_numpy(dtype=np.float64)
+        total_vols = r.std(axis=0, ddof=1) * ANNUALIZED_VOL_PCT
+
+        # Flat market returns: beta is undefined, skip the (degenerate) solve
+        if market.var() < MIN_MARKET_RETURN_VAR:
+            idio_vols = [None] * len(stacked_symbols)
+        else:
+            x = np.column_stack([np.ones(len(market)), market])  # (T, 2)
+
+            # One solve for all symbols: coef rows are (alpha, beta)
+            coef, *_ = np.linalg.lstsq(x, r, rcond=None)
+            residuals = r - x @ coef
+            idio_vols = (residuals.std(axis=0, ddof=1) * ANNUALIZED_VOL_PCT).tolist()
+
+        for symbol, idio_vol, total_vol in zip(
+            stacked_symbols, idio_vols, total_vols.tolist(), strict=True
+        ):
+            results[symbol] = {"idio_vol": idio_vol, "total_vol": total_vol}
+
+    return results
+
+
 def get_ticker_data(symbol: str, include_momentum: bool = False) -> dict[str, Any]:
-    """Fetch current data for a single ticker"""
+    """Fetch current data for a single ticker (concurrent identical lookups coalesced)"""
+    return _coalesce(
+        ("ticker", f"{symbol}:{include_momentum}"),
+        lambda: _fetch_ticker_data(symbol, include_momentum),
+    )
+
+
+def _fetch_ticker_data(symbol: str, include_momentum: bool) -> dict[str, Any]:
+    """Fetch current data for a single ticker (uncoalesced)"""
     try:
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
+        ticker = get_ticker(symbol)
+        info = get_ticker_info(symbol, ticker)
 
         price = info.get("regularMarketPrice") or info.get("currentPrice")
         change_pct = info.get("regularMarketChangePercent")
@@ -492,33 +852,48 @@ def get_ticker_data(symbol: str, include_momentum: bool = False) -> dict[str, An
         return {"symbol": symbol, "error": str(e)}
 
 
-def get_ticker_full_data(symbol: str) -> dict[str, Any]:
-    """Fetch comprehensive ticker data (price, momentum) for markets() screen using fast_info"""
-    try:
-        ticker = yf.Ticker(symbol)
+def get_ticker_full_data(
+    symbol: str,
+    closes: Any = None,  # noqa: ANN401
+    target_dates: tuple[datetime, datetime, datetime] | None = None,
+) -> dict[str, Any]:
+    """
+    Fetch comprehensive ticker data (price, momentum) for markets() screen
 
+    If closes (1Y daily Close series, e.g. from fetch_batch_closes) is given, price,
+    change and momentum come from it - no HTTP calls
+    """
+    try:
         # Futures require special handling - fast_info.previousClose is wrong reference
-        # Futures trade 24/7, so we need ticker.info.regularMarketChangePercent which
-        # uses the correct 6pm ET settlement price as baseline
+        # Futures trade 24/7 (its hourly pre/post bars roll over at midnight), so the
+        # baseline must be the 6pm ET settlement: the previous *daily* bar's close.
+        # Daily bars (batch closes, or fast_info.regularMarketPreviousClose) carry it
+        # without the heavy ticker.info quoteSummary request
         is_futures = symbol.endswith("=F")
 
-        if is_futures:
-            # Use info for futures (slower but accurate)
-            info = ticker.info
-            price = info.get("regularMarketPrice") or info.get("currentPrice")
-            change_pct = info.get("regularMarketChangePercent")
+        if closes is not None:
+            closes = closes.dropna()
+
+        if closes is not None and len(closes) >= MIN_HISTORY_LEN:
+            # Latest daily bar (today's, intraday) vs previous session close/settlement
+            price = float(closes.iloc[-1])
+            prev_close = float(closes.iloc[-2])
+            change_pct = ((price - prev_close) / prev_close) * 100 if prev_close else None
         else:
-            # Use fast_info for equities/ETFs (faster)
+            # Use fast_info (faster than info; futures read the daily-bar settlement)
+            ticker = get_ticker(symbol)
             price = ticker.fast_info.get("lastPrice")
-            prev_close = ticker.fast_info.get("previousClose")
+            prev_close = ticker.fast_info.get(
+                "regularMarketPreviousClose" if is_futures else "previousClose"
+            )
 
             # Calculate change percent from fast_info data
             change_pct = None
             if price is not None and prev_close is not None and prev_close != 0:
                 change_pct = ((price - prev_close) / prev_close) * 100
 
-        # Get momentum (already optimized with narrow windows)
-        momentum = calculate_momentum(symbol)
+        # Get momentum (sliced from closes when given, else narrow-window fetches)
+        momentum = calculate_momentum(symbol, closes, target_dates)
 
         return {
             "symbol": symbol,
@@ -531,63 +906,65 @@ def get_ticker_full_data(symbol: str) -> dict[str, Any]:
         return {"symbol": symbol, "error": str(e)}
 
 
+def _snapshot_fetch_list(categories: list[str]) -> list[tuple[str, str]]:
+    """Resolve snapshot categories (or symbol keys) to unique (key, symbol) pairs"""
+    # Auto-detect: if no categories specified, show comprehensive global view with factors
+    if not categories:
+        categories = list(
+            DEFAULT_CATEGORIES_MARKET_OPEN if is_market_open() else DEFAULT_CATEGORIES_MARKET_CLOSED
+        )
+
+    # Concatenate precomputed (key, symbol) pairs per category (or specific symbol key)
+    # Categories overlap (e.g. "factors" + "volatility" both have vix) - fetch each key once
+    return list(dict.fromkeys(chain.from_iterable(
+        SYMBOLS_BY_CATEGORY.get(cat.lower(), ()) for cat in categories
+    )))
+
+
 def get_market_snapshot(
     categories: list[str],
     show_momentum: bool = False
 ) -> dict[str, dict[str, Any]]:
     """Get snapshot of multiple market categories"""
-    # Auto-detect: if no categories specified, show comprehensive global view with factors
-    if not categories:
-        if is_market_open():
-            categories = ["us", "volatility", "commodities", "rates", "sectors", "styles",
-                         "crypto", "europe", "asia", "currencies"]
-        else:
-            categories = ["futures", "volatility", "commodities", "rates", "sectors", "styles",
-                         "crypto", "europe", "asia", "currencies"]
-
-    # Build symbol list based on categories
-    symbols_to_fetch: list[str] = []
-    for cat in categories:
-        category = cat.lower()
-        # Performance: O(1) dict lookup instead of if/elif chain
-        if category in CATEGORY_MAPPING:
-            symbols_to_fetch.extend(CATEGORY_MAPPING[category])
-        elif category in MARKET_SYMBOLS:
-            # Check if it's a specific symbol key
-            symbols_to_fetch.append(category)
-
-    # Build list of (key, symbol) pairs to fetch
-    fetch_list = [
-        (key, symbol)
-        for key in symbols_to_fetch
-        if (symbol := MARKET_SYMBOLS.get(key)) is not None
-    ]
+    fetch_list = _snapshot_fetch_list(categories)
+    if not fetch_list:
+        return {}
 
-    # Fetch data in parallel using ThreadPoolExecutor
+    # Fetch data in parallel on the shared fan-out pool
     # Performance: Parallel I/O (network requests) instead of sequential
-    results: dict[str, dict[str, Any]] = {}
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        # Submit all fetch tasks
-        future_to_key = {
-            executor.submit(get_ticker_data, symbol, show_momentum): key
-            for key, symbol in fetch_list
-        }
+    # Results come back in fetch order; get_ticker_data turns failures into error dicts
+    fetched = FANOUT_EXECUTOR.map(
+        lambda symbol: get_ticker_data(symbol, show_momentum),
+        [symbol for _, symbol in fetch_list],
+    )
+    return {key: data for (key, _), data in zip(fetch_list, fetched, strict=True)}
 
-        # Collect results as they complete
-        for future in as_completed(future_to_key):
-            key = future_to_key[future]
-            try:
-                results[key] = future.result()
-            except Exception as e:
-                results[key] = {"symbol": key, "error": str(e)}
 
-    return results
+def get_ticker_history(symbol: str, period: str = "1mo") -> dict[str, Any]:
+    """Get historical price data for a ticker (concurrent identical lookups coalesced)"""
+    return _coalesce(
+        ("history", f"{symbol}:{period}"),
+        lambda: _fetch_ticker_history(symbol, period),
+    )
 
 
-def get_ticker_history(symbol: str, period: str = "1mo") -> dict[str, Any]:
-    """Get historical price data for a ticker"""
+def _history_records(hist: Any) -> list[dict[str, Any]]:  # noqa: ANN401
+    """
+    hist.to_dict("records"), built from one tolist() per column
+
+    Same row dicts and native Python values, ~3x faster than pandas' per-row boxing
+    """
+    columns = list(hist.columns)
+    return [
+        dict(zip(columns, row, strict=True))
+        for row in zip(*(hist[column].tolist() for column in columns), strict=True)
+    ]
+
+
+def _fetch_ticker_history(symbol: str, period: str) -> dict[str, Any]:
+    """Get historical price data for a ticker (uncoalesced)"""
     try:
-        ticker = yf.Ticker(symbol)
+        ticker = get_ticker(symbol)
         hist = ticker.history(period=period)
 
         if hist.empty:
@@ -596,7 +973,7 @@ def get_ticker_history(symbol: str, period: str = "1mo") -> dict[str, Any]:
         return {
             "symbol": symbol,
             "period": period,
-            "data": hist.to_dict("records"),
+            "data": _history_records(hist),
             "start_date": hist.index[0].isoformat(),
             "end_date": hist.index[-1].isoformat(),
         }
@@ -609,76 +986,75 @@ def get_ticker_history(symbol: str, period: str = "1mo") -> dict[str, Any]:
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 
-def get_markets_data() -> dict[str, dict[str, Any]]:
-    """Fetch all market data for markets() screen - complete market overview"""
-    # Symbols to fetch - all market factors
-    symbols_to_fetch = [
-        # US Equities (cash indices)
-        ("sp500", "^GSPC"),
-        ("nasdaq", "^IXIC"),
-        ("dow", "^DJI"),
-        ("russell2000", "^RUT"),
-        # US Futures
-        ("es_futures", "ES=F"),
-        ("nq_futures", "NQ=F"),
-        ("ym_futures", "YM=F"),
-        # Global - Asia/Pacific
-        ("nikkei", "^N225"),
-        ("hangseng", "^HSI"),
-        ("shanghai", "000001.SS"),
-        ("kospi", "^KS11"),
-        ("nifty50", "^NSEI"),
-        ("asx200", "^AXJO"),
-        ("taiwan", "^TWII"),
-        # Global - Europe
-        ("stoxx50", "^STOXX50E"),
-        # Global - Latin America
-        ("bovespa", "^BVSP"),
-        # Sectors (all 11 GICS)
-        ("tech", "XLK"),
-        ("financials", "XLF"),
-        ("healthcare", "XLV"),
-        ("energy", "XLE"),
-        ("consumer_disc", "XLY"),
-        ("consumer_stpl", "XLP"),
-        ("industrials", "XLI"),
-        ("utilities", "XLU"),
-        ("materials", "XLB"),
-        ("real_estate", "XLRE"),
-        ("communication", "XLC"),
-        # Styles
-        ("momentum", "MTUM"),
-        ("value", "VTV"),
-        ("growth", "VUG"),
-        ("quality", "QUAL"),
-        ("small_cap", "IWM"),
-        # Private Credit
-        ("private_credit", "BIZD"),
-        # Commodities
-        ("gold", "GC=F"),
-        ("oil_wti", "CL=F"),
-        ("natgas", "NG=F"),
-        # Volatility & Rates
-        ("vix", "^VIX"),
-        ("us10y", "^TNX"),
-    ]
-
-    # Fetch in parallel
-    results: dict[str, dict[str, Any]] = {}
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        future_to_key = {
-            executor.submit(get_ticker_full_data, symbol): key
-            for key, symbol in symbols_to_fetch
-        }
+# markets() screen symbols - all market factors, as (key, symbol) pairs
+MARKETS_SCREEN_SYMBOLS: tuple[tuple[str, str], ...] = (
+    # US Equities (cash indices)
+    ("sp500", "^GSPC"),
+    ("nasdaq", "^IXIC"),
+    ("dow", "^DJI"),
+    ("russell2000", "^RUT"),
+    # US Futures
+    ("es_futures", "ES=F"),
+    ("nq_futures", "NQ=F"),
+    ("ym_futures", "YM=F"),
+    # Global - Asia/Pacific
+    ("nikkei", "^N225"),
+    ("hangseng", "^HSI"),
+    ("shanghai", "000001.SS"),
+    ("kospi", "^KS11"),
+    ("nifty50", "^NSEI"),
+    ("asx200", "^AXJO"),
+    ("taiwan", "^TWII"),
+    # Global - Europe
+    ("stoxx50", "^STOXX50E"),
+    # Global - Latin America
+    ("bovespa", "^BVSP"),
+    # Sectors (all 11 GICS)
+    ("tech", "XLK"),
+    ("financials", "XLF"),
+    ("healthcare", "XLV"),
+    ("energy", "XLE"),
+    ("consumer_disc", "XLY"),
+    ("consumer_stpl", "XLP"),
+    ("industrials", "XLI"),
+    ("utilities", "XLU"),
+    ("materials", "XLB"),
+    ("real_estate", "XLRE"),
+    ("communication", "XLC"),
+    # Styles
+    ("momentum", "MTUM"),
+    ("value", "VTV"),
+    ("growth", "VUG"),
+    ("quality", "QUAL"),
+    ("small_cap", "IWM"),
+    # Private Credit
+    ("private_credit", "BIZD"),
+    # Commodities
+    ("gold", "GC=F"),
+    ("oil_wti", "CL=F"),
+    ("natgas", "NG=F"),
+    # Volatility & Rates
+    ("vix", "^VIX"),
+    ("us10y", "^TNX"),
+)
 
-        for future in as_completed(future_to_key):
-            key = future_to_key[future]
-            try:
-                results[key] = future.result()
-            except Exception as e:
-                results[key] = {"symbol": key, "error": str(e)}
 
-    return results
+def get_markets_data() -> dict[str, dict[str, Any]]:
+    """Fetch all market data for markets() screen - complete market overview"""
+    symbols_to_fetch = MARKETS_SCREEN_SYMBOLS
+
+    # One bulk 1Y daily download covers price, change and momentum for every symbol
+    # (~40 fast_info + ~120 narrow history requests collapse into one yf.download)
+    closes_by_symbol = fetch_batch_closes([symbol for _, symbol in symbols_to_fetch])
+    target_dates = momentum_target_dates()
+
+    # Fetch in parallel - only symbols the bulk download missed still hit the network
+    # Results come back in screen order; get_ticker_full_data returns error dicts itself
+    fetched = FANOUT_EXECUTOR.map(
+        lambda symbol: get_ticker_full_data(symbol, closes_by_symbol.get(symbol), target_dates),
+        [symbol for _, symbol in symbols_to_fetch],
+    )
+    return {key: data for (key, _), data in zip(symbols_to_fetch, fetched, strict=True)}
 
 
 def format_markets(data: dict[str, dict[str, Any]]) -> str:  # noqa: PLR0912, PLR0915
@@ -803,6 +1179,50 @@ def format_markets(data: dict[str, dict[str, Any]]) -> str:  # noqa: PLR0912, PL
     return "\n".join(lines)
 
 
+def _fetch_holding_perf(
+    symbol: str,
+    closes: Any = None,  # noqa: ANN401
+    target_dates: tuple[datetime, datetime, datetime] | None = None,
+) -> dict[str, Any]:
+    """
+    Fetch price change and momentum for a single sector holding (uncoalesced)
+
+    If closes (1Y daily Close series from fetch_batch_closes) is given, everything
+    is computed from it - no HTTP calls
+    """
+    if closes is not None:
+        closes = closes.dropna()
+
+    if closes is not None and len(closes) >= MIN_HISTORY_LEN:
+        # Latest daily bar vs previous session close
+        last_close = float(closes.iloc[-1])
+        prev_session_close = float(closes.iloc[-2])
+        change_pct = (
+            ((last_close - prev_session_close) / prev_session_close) * 100
+            if prev_session_close
+            else None
+        )
+    else:
+        # Use fast_info instead of info (much faster), via the short-TTL quote cache
+        quote = get_fast_info(symbol)
+        price = quote.get("lastPrice")
+        prev_close = quote.get("previousClose")
+
+        # Calculate change percent
+        change_pct = None
+        if price is not None and prev_close is not None and prev_close != 0:
+            change_pct = ((price - prev_close) / prev_close) * 100
+
+    # Momentum sliced from closes when given, else optimized narrow-window fetches
+    momentum = calculate_momentum(symbol, closes, target_dates)
+
+    return {
+        "change_percent": change_pct,
+        "momentum_1m": momentum.get("momentum_1m"),
+        "momentum_1y": momentum.get("momentum_1y"),
+    }
+
+
 def get_sector_data(name: str) -> dict[str, Any]:
     """Fetch sector data for sector() screen"""
     # Normalize sector name: "real estate" -> "real_estate", "technology" -> "tech"
@@ -829,35 +1249,26 @@ def get_sector_data(name: str) -> dict[str, Any]:
 
     # Get top holdings with performance data (using yfinance batch API to avoid hammering server)
     try:
-        ticker = yf.Ticker(sector_symbol)
+        ticker = get_ticker(sector_symbol)
         holdings_df = ticker.funds_data.top_holdings
 
         # Get list of symbols for parallel fetch
         symbols = list(holdings_df.head(10).index)
 
-        # Fetch all holdings data in parallel using ThreadPoolExecutor
+        # One bulk 1Y daily download covers change and momentum for every holding
+        # (~10 fast_info + ~30 narrow history requests collapse into one yf.download)
+        closes_by_symbol = fetch_batch_closes(symbols)
+        target_dates = momentum_target_dates()
+
         def fetch_holding_data(symbol: str) -> dict[str, Any]:
             """Fetch price and momentum data for a single holding"""
             try:
-                ticker = yf.Ticker(symbol)
-
-                # Use fast_info instead of info (much faster)
-                price = ticker.fast_info.get("lastPrice")
-                prev_close = ticker.fast_info.get("previousClose")
-
-                # Calculate change percent
-                change_pct = None
-                if price is not None and prev_close is not None and prev_close != 0:
-                    change_pct = ((price - prev_close) / prev_close) * 100
-
-                # Use optimized momentum calculation (narrow windows, not full year)
-                momentum = calculate_momentum(symbol)
-
-                return {
-                    "change_percent": change_pct,
-                    "momentum_1m": momentum.get("momentum_1m"),
-                    "momentum_1y": momentum.get("momentum_1y"),
-                }
+                closes = closes_by_symbol.get(symbol)
+                if closes is not None:
+                    return _fetch_holding_perf(symbol, closes, target_dates)
+                # Missed by the bulk download - per-symbol fetch; holdings overlap
+                # across sectors (AAPL, MSFT, ...) so share concurrent fetches
+                return _coalesce(("holding", symbol), lambda: _fetch_holding_perf(symbol))
             except Exception:
                 return {
                     "change_percent": None,
@@ -865,24 +1276,12 @@ def get_sector_data(name: str) -> dict[str, Any]:
                     "momentum_1y": None,
                 }
 
-        # Parallel fetch with ThreadPoolExecutor (10 concurrent requests)
-        performance_data: dict[str, dict[str, Any]] = {}
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_symbol = {
-                executor.submit(fetch_holding_data, symbol): symbol
-                for symbol in symbols
-            }
-
-            for future in as_completed(future_to_symbol):
-                symbol = future_to_symbol[future]
-                try:
-                    performance_data[symbol] = future.result()
-                except Exception:
-                    performance_data[symbol] = {
-                        "change_percent": None,
-                        "momentum_1m": None,
-                        "momentum_1y": None,
-                    }
+        # Parallel on the shared fan-out pool - only symbols the bulk download missed
+        # still hit the network
+        # (fetch_holding_data never raises - failures come back as all-None rows)
+        performance_data = dict(
+            zip(symbols, FANOUT_EXECUTOR.map(fetch_holding_data, symbols), strict=True)
+        )
 
         # Build holdings list with performance data
         holdings = []
@@ -978,34 +1377,84 @@ def format_sector(data: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+# info keys read by the ticker() screen, unpacked in one itemgetter call
+_SCREEN_INFO_KEYS = (
+    "regularMarketPrice",
+    "currentPrice",
+    "regularMarketChange",
+    "regularMarketChangePercent",
+    "marketCap",
+    "volume",
+    "longName",
+    "shortName",
+    "beta",
+    "trailingPE",
+    "forwardPE",
+    "dividendYield",
+    "fiftyDayAverage",
+    "twoHundredDayAverage",
+    "fiftyTwoWeekHigh",
+    "fiftyTwoWeekLow",
+)
+_SCREEN_INFO_BLANK = dict.fromkeys(_SCREEN_INFO_KEYS)
+_screen_info_getter = itemgetter(*_SCREEN_INFO_KEYS)
+
+
+def extract_screen_fields(info: dict[str, Any], symbol: str) -> dict[str, Any]:
+    """Pull the ticker() screen fields out of ticker.info (missing keys become None)"""
+    (
+        market_price,
+        current_price,
+        change,
+        change_pct,
+        market_cap,
+        volume,
+        long_name,
+        short_name,
+        beta_spx,
+        trailing_pe,
+        forward_pe,
+        dividend_yield,
+        fifty_day_avg,
+        two_hundred_day_avg,
+        fifty_two_week_high,
+        fifty_two_week_low,
+    ) = _screen_info_getter({**_SCREEN_INFO_BLANK, **info})
+
+    return {
+        "name": long_name or short_name or symbol,
+        "price": market_price or current_price,
+        "change": change,
+        "change_percent": change_pct,
+        "market_cap": market_cap,
+        "volume": volume,
+        "beta_spx": beta_spx,
+        "trailing_pe": trailing_pe,
+        "forward_pe": forward_pe,
+        "dividend_yield": dividend_yield,
+        "fifty_day_avg": fifty_day_avg,
+        "two_hundred_day_avg": two_hundred_day_avg,
+        "fifty_two_week_high": fifty_two_week_high,
+        "fifty_two_week_low": fifty_two_week_low,
+    }
+
+
 def get_ticker_screen_data(symbol: str) -> dict[str, Any]:
-    """Fetch comprehensive ticker data for ticker() screen"""
+    """Fetch comprehensive ticker data for ticker() screen (concurrent lookups coalesced)"""
     try:
         symbol = normalize_ticker_symbol(symbol)
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
-
-        # Basic price data
-        price = info.get("regularMarketPrice") or info.get("currentPrice")
-        change = info.get("regularMarketChange")
-        change_pct = info.get("regularMarketChangePercent")
-        market_cap = info.get("marketCap")
-        volume = info.get("volume")
-        name = info.get("longName") or info.get("shortName") or symbol
+    except ValueError as e:
+        return {"symbol": symbol, "error": str(e)}
+    return _coalesce(("screen", symbol), lambda: _fetch_ticker_screen_data(symbol))
 
-        # Factor exposures
-        beta_spx = info.get("beta")
 
-        # Valuation
-        trailing_pe = info.get("trailingPE")
-        forward_pe = info.get("forwardPE")
-        dividend_yield = info.get("dividendYield")
+def _fetch_ticker_screen_data(symbol: str) -> dict[str, Any]:
+    """Fetch comprehensive ticker data for ticker() screen (uncoalesced, symbol normalized)"""
+    try:
+        ticker = get_ticker(symbol)
+        info = get_ticker_info(symbol, ticker)
 
-        # Technicals
-        fifty_day_avg = info.get("fiftyDayAverage")
-        two_hundred_day_avg = info.get("twoHundredDayAverage")
-        fifty_two_week_high = info.get("fiftyTwoWeekHigh")
-        fifty_two_week_low = info.get("fiftyTwoWeekLow")
+        fields = extract_screen_fields(info, symbol)
 
         # Get momentum
         momentum = calculate_momentum(symbol)
@@ -1038,24 +1487,12 @@ def get_ticker_screen_data(symbol: str) -> dict[str, Any]:
             pass
 
         # Get options data
-        options_data = get_options_data(symbol, "nearest")
+        # (the summary shows nearest-expiration positioning only - skip the other chains)
+        options_data = get_options_data(symbol, "nearest", include_all_expirations=False)
 
         return {
             "symbol": symbol,
-            "name": name,
-            "price": price,
-            "change": change,
-            "change_percent": change_pct,
-            "market_cap": market_cap,
-            "volume": volume,
-            "beta_spx": beta_spx,
-            "trailing_pe": trailing_pe,
-            "forward_pe": forward_pe,
-            "dividend_yield": dividend_yield,
-            "fifty_day_avg": fifty_day_avg,
-            "two_hundred_day_avg": two_hundred_day_avg,
-            "fifty_two_week_high": fifty_two_week_high,
-            "fifty_two_week_low": fifty_two_week_low,
+            **fields,
             "momentum_1w": momentum.get("momentum_1w"),
             "momentum_1m": momentum.get("momentum_1m"),
             "momentum_1y": momentum.get("momentum_1y"),
@@ -1075,52 +1512,63 @@ def get_ticker_screen_data_batch(symbols: list[str]) -> list[dict[str, Any]]:
     if not symbols:
         return []
 
-    # Normalize all symbols
-    symbols = [normalize_ticker_symbol(s) for s in symbols]
+    # Normalize all symbols - malformed ones are rejected here, with no network call
+    entries: list[tuple[str, str | None]] = []  # (symbol, validation error)
+    for raw_symbol in symbols:
+        try:
+            entries.append((normalize_ticker_symbol(raw_symbol), None))
+        except ValueError as e:
+            entries.append((raw_symbol, str(e)))
+
+    symbols = [symbol for symbol, invalid in entries if invalid is None]
+    if not symbols:
+        return [{"symbol": symbol, "error": invalid} for symbol, invalid in entries]
+
+    # One bulk 1Y download covers momentum, idio vol and RSI inputs for every symbol
+    # (plus the market index for beta) instead of ~5 history calls per symbol
+    market_symbol = MARKET_SYMBOLS["sp500"]
+    closes_by_symbol = fetch_batch_closes([*symbols, market_symbol])
+    market_closes = closes_by_symbol.get(market_symbol)
 
-    # Batch fetch all tickers at once (single request to Yahoo, not N separate requests)
-    tickers_obj = yf.Tickers(" ".join(symbols))
+    # Beta regression for every symbol in one stacked least-squares solve
+    idio_vols = calculate_idio_vol_batch(symbols, closes_by_symbol)
+
+    # Momentum lookback dates are the same for every symbol - compute once
+    target_dates = momentum_target_dates()
+
+    # Per-symbol info/calendar/news lookups are independent HTTP calls - run them on
+    # the shared fan-out pool so the batch costs ~max latency, not the sum
+    def screen_one(entry: tuple[str, str | None]) -> dict[str, Any]:
+        symbol, invalid = entry
+        if invalid is not None:
+            return {"symbol": symbol, "error": invalid}
 
-    results = []
-    for symbol in symbols:
         try:
-            ticker_obj = tickers_obj.tickers[symbol]
-            info = ticker_obj.info
-
-            # Basic price data
-            price = info.get("regularMarketPrice") or info.get("currentPrice")
-            change = info.get("regularMarketChange")
-            change_pct = info.get("regularMarketChangePercent")
-            market_cap = info.get("marketCap")
-            volume = info.get("volume")
-            name = info.get("longName") or info.get("shortName") or symbol
-
-            # Factor exposures
-            beta_spx = info.get("beta")
-
-            # Valuation
-            trailing_pe = info.get("trailingPE")
-            forward_pe = info.get("forwardPE")
-            dividend_yield = info.get("dividendYield")
-
-            # Technicals
-            fifty_day_avg = info.get("fiftyDayAverage")
-            two_hundred_day_avg = info.get("twoHundredDayAverage")
-            fifty_two_week_high = info.get("fiftyTwoWeekHigh")
-            fifty_two_week_low = info.get("fiftyTwoWeekLow")
+            # Same process-wide Ticker the single-symbol tools use (shared fast_info/info)
+            ticker_obj = get_ticker(symbol)
+            info = get_ticker_info(symbol, ticker_obj)
+
+            fields = extract_screen_fields(info, symbol)
+
+            closes = closes_by_symbol.get(symbol)
 
             # Get momentum
-            momentum = calculate_momentum(symbol)
+            momentum = calculate_momentum(symbol, closes, target_dates)
 
-            # Get idio vol
-            vol_data = calculate_idio_vol(symbol)
+            # Get idio vol (per-symbol fallback if the bulk download missed it)
+            vol_data = idio_vols.get(symbol) or calculate_idio_vol(
+                symbol, closes, market_closes
+            )
 
-            # Calculate RSI
+            # Calculate RSI (same ~1 month window as the single-ticker screen)
             rsi = None
             try:
-                hist = ticker_obj.history(period="1mo", interval="1d")
-                if not hist.empty and len(hist) >= RSI_PERIOD:
-                    rsi = calculate_rsi(hist["Close"])
+                if closes is not None:
+                    rsi = calculate_rsi(closes.iloc[-TRADING_DAYS_PER_MONTH:])
+                else:
+                    hist = ticker_obj.history(period="1mo", interval="1d")
+                    if not hist.empty and len(hist) >= RSI_PERIOD:
+                        rsi = calculate_rsi(hist["Close"])
             except Exception:
                 pass
 
@@ -1139,22 +1587,9 @@ def get_ticker_screen_data_batch(symbols: list[str]) -> list[dict[str, Any]]:
             except Exception:
                 pass
 
-            results.append({
+            return {
                 "symbol": symbol,
-                "name": name,
-                "price": price,
-                "change": change,
-                "change_percent": change_pct,
-                "market_cap": market_cap,
-                "volume": volume,
-                "beta_spx": beta_spx,
-                "trailing_pe": trailing_pe,
-                "forward_pe": forward_pe,
-                "dividend_yield": dividend_yield,
-                "fifty_day_avg": fifty_day_avg,
-                "two_hundred_day_avg": two_hundred_day_avg,
-                "fifty_two_week_high": fifty_two_week_high,
-                "fifty_two_week_low": fifty_two_week_low,
+                **fields,
                 "momentum_1w": momentum.get("momentum_1w"),
                 "momentum_1m": momentum.get("momentum_1m"),
                 "momentum_1y": momentum.get("momentum_1y"),
@@ -1163,11 +1598,12 @@ def get_ticker_screen_data_batch(symbols: list[str]) -> list[dict[str, Any]]:
                 "rsi": rsi,
                 "calendar": calendar,
                 "news_preview": news_preview,
-            })
+            }
         except Exception as e:
-            results.append({"symbol": symbol, "error": str(e)})
+            return {"symbol": symbol, "error": str(e)}
 
-    return results
+    # Results come back in request order; screen_one returns error dicts itself
+    return list(FANOUT_EXECUTOR.map(screen_one, entries))
 
 
 def format_ticker(data: dict[str, Any]) -> str:  # noqa: PLR0912, PLR0915
@@ -1423,7 +1859,7 @@ def format_ticker_batch(data_list: list[dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
-def format_market_snapshot(data: dict[str, dict[str, Any]]) -> str:  # noqa: PLR0912
+def format_market_snapshot(data: dict[str, dict[str, Any]]) -> str:
     """Format market data into concise readable text (BBG Lite style)"""
     now = datetime.now(ZoneInfo("America/New_York"))
     date_str = now.strftime("%Y-%m-%d")
@@ -1443,8 +1879,8 @@ def format_market_snapshot(data: dict[str, dict[str, Any]]) -> str:  # noqa: PLR
         if section_name == "MARKET FUTURES" and market_is_open:
             continue
 
-        # Check if any symbols in this section are in our data
-        section_data = {k: v for k, v in data.items() if k in symbols}
+        # Symbols in this section that are in our data (section order, O(1) dict hits)
+        section_data = [(key, data[key]) for key in symbols if key in data]
         if not section_data:
             continue
 
@@ -1457,40 +1893,31 @@ def format_market_snapshot(data: dict[str, dict[str, Any]]) -> str:  # noqa: PLR
             section_header = section_name
 
         lines.append(section_header)
-        for symbol, info in section_data.items():
+        for symbol, info in section_data:
+            display_name = DISPLAY_NAMES.get(symbol, symbol)
             if info.get("error"):
-                display_name = DISPLAY_NAMES.get(symbol, symbol)
                 lines.append(f"{display_name:12} ERROR - {info['error']}")
+                continue
+
+            price = info.get("price")
+            change_pct = info.get("change_percent")
+            momentum_1m = info.get("momentum_1m")
+            momentum_1y = info.get("momentum_1y")
+
+            if price is None:
+                lines.append(f"{display_name:12} N/A")
+            elif change_pct is None:
+                lines.append(f"{display_name:12} {price:10.2f}")
             else:
-                price = info.get("price")
-                change_pct = info.get("change_percent")
-                momentum_1m = info.get("momentum_1m")
-                momentum_1y = info.get("momentum_1y")
-
-                # Check if we have momentum data
-                has_momentum = momentum_1m is not None or momentum_1y is not None
-
-                if price is not None and change_pct is not None:
-                    display_name = DISPLAY_NAMES.get(symbol, symbol)
-                    line = f"{display_name:12} {price:10.2f}  {change_pct:+6.2f}%"
-
-                    # Add momentum columns if available
-                    if has_momentum:
-                        mom_1m_str = (
-                            f"{momentum_1m:+6.1f}%" if momentum_1m is not None else "   N/A"
-                        )
-                        mom_1y_str = (
-                            f"{momentum_1y:+6.1f}%" if momentum_1y is not None else "   N/A"
-                        )
-                        line += f"  {mom_1m_str} (1M)  {mom_1y_str} (1Y)"
-
-                    lines.append(line)
-                elif price is not None:
-                    display_name = DISPLAY_NAMES.get(symbol, symbol)
-                    lines.append(f"{display_name:12} {price:10.2f}")
-                else:
-                    display_name = DISPLAY_NAMES.get(symbol, symbol)
-                    lines.append(f"{display_name:12} N/A")
+                line = f"{display_name:12} {price:10.2f}  {change_pct:+6.2f}%"
+
+                # Add momentum columns if available
+                if momentum_1m is not None or momentum_1y is not None:
+                    mom_1m_str = f"{momentum_1m:+6.1f}%" if momentum_1m is not None else "   N/A"
+                    mom_1y_str = f"{momentum_1y:+6.1f}%" if momentum_1y is not None else "   N/A"
+                    line += f"  {mom_1m_str} (1M)  {mom_1y_str} (1Y)"
+
+                lines.append(line)
         lines.append("")  # blank line between sections
 
     # Footer with guidance
@@ -1505,7 +1932,7 @@ def format_market_snapshot(data: dict[str, dict[str, Any]]) -> str:  # noqa: PLR
 
 def get_news_data(symbol: str) -> dict[str, Any]:
     """Fetch news articles for a ticker symbol"""
-    ticker = yf.Ticker(symbol)
+    ticker = get_ticker(symbol)
 
     try:
         news = ticker.get_news()
@@ -1587,20 +2014,144 @@ def format_news(data: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def get_options_data(symbol: str, expiration: str = "nearest") -> dict[str, Any]:  # noqa: PLR0915, PLR0912
+MAX_PAIN_BROADCAST_LIMIT = 128  # Above this many strikes, skip the N^2 payoff matrix
+
+
+def calculate_max_pain(
+    call_strikes: Any,  # noqa: ANN401
+    call_oi: Any,  # noqa: ANN401
+    put_strikes: Any,  # noqa: ANN401
+    put_oi: Any,  # noqa: ANN401
+) -> float:
+    """
+    Strike where total intrinsic value owed to option holders is smallest
+
+    Vectorized with NumPy broadcasting: a (candidates x contracts) payoff matrix times
+    the OI vector, instead of a Python loop over every strike pair. Wide chains
+    (SPY, QQQ) switch to prefix sums so memory stays O(N). Missing OI counts as 0;
+    ties go to the lowest strike.
+    """
+    c_strikes = np.asarray(call_strikes, dtype=np.float64)
+    p_strikes = np.asarray(put_strikes, dtype=np.float64)
+    c_oi = np.nan_to_num(np.asarray(call_oi, dtype=np.float64))
+    p_oi = np.nan_to_num(np.asarray(put_oi, dtype=np.float64))
+
+    candidates = np.union1d(c_strikes, p_strikes)  # Sorted, unique
+    if len(candidates) == 0:
+        return 0.0
+
+    if len(candidates) > MAX_PAIN_BROADCAST_LIMIT:
+        call_pain, put_pain = _max_pain_prefix_sums(candidates, c_strikes, c_oi, p_strikes, p_oi)
+    else:
+        call_pain = np.maximum(candidates[:, None] - c_strikes[None, :], 0.0) @ c_oi
+        put_pain = np.maximum(p_strikes[None, :] - candidates[:, None], 0.0) @ p_oi
+    return float(candidates[np.argmin(call_pain + put_pain)])
+
+
+def _max_pain_prefix_sums(
+    candidates: Any,  # noqa: ANN401
+    c_strikes: Any,  # noqa: ANN401
+    c_oi: Any,  # noqa: ANN401
+    p_strikes: Any,  # noqa: ANN401
+    p_oi: Any,  # noqa: ANN401
+) -> tuple[Any, Any]:
+    """
+    Call and put pain per candidate strike in O(N log N) time and O(N) memory
+
+    Call pain at K is sum over strikes s < K of (K - s) * oi = K * OI(<K) - (s*oi)(<K),
+    so cumulative sums over the sorted strikes plus a searchsorted per candidate
+    replace the (candidates x contracts) matrix. Puts mirror it over strikes > K.
+    """
+    order = np.argsort(c_strikes, kind="stable")
+    cs, co = c_strikes[order], c_oi[order]
+    cum_oi = np.concatenate(([0.0], np.cumsum(co)))
+    cum_soi = np.concatenate(([0.0], np.cumsum(cs * co)))
+    below = np.searchsorted(cs, candidates, side="left")
+    call_pain = candidates * cum_oi[below] - cum_soi[below]
+
+    order = np.argsort(p_strikes, kind="stable")
+    ps, po = p_strikes[order], p_oi[order]
+    cum_oi = np.concatenate(([0.0], np.cumsum(po)))
+    cum_soi = np.concatenate(([0.0], np.cumsum(ps * po)))
+    upto = np.searchsorted(ps, candidates, side="right")
+    put_pain = (cum_soi[-1] - cum_soi[upto]) - candidates * (cum_oi[-1] - cum_oi[upto])
+    return call_pain, put_pain
+
+
+def _atm_strike(strikes: Any, price: float) -> float:  # noqa: ANN401
+    """Strike closest to price (first on ties) - O(N) argmin on the raw array, no sort"""
+    return float(strikes.iat[int(np.abs(strikes.to_numpy(dtype=np.float64) - price).argmin())])
+
+
+OPTIONS_TOP_N = 10
+OPTIONS_HIST_3MO_SESSIONS = 63  # ~3 months of trading days (the old period="3mo" fetch)
+OPTIONS_VOL_WINDOW = 30  # Rolling historical-vol window for the 52-week IV range
+OPTIONS_TOP_COLUMNS = ["strike", "openInterest", "volume", "lastPrice", "impliedVolatility"]
+
+
+def _chain_arrays(frame: Any) -> tuple[Any, Any, Any, Any]:  # noqa: ANN401
+    """(strike, openInterest, volume, impliedVolatility) of a chain side as float64 arrays"""
+    return tuple(
+        frame[col].to_numpy(dtype=np.float64)
+        for col in ("strike", "openInterest", "volume", "impliedVolatility")
+    )
+
+
+def _option_records(frame: Any) -> list[dict[str, Any]]:  # noqa: ANN401
+    """Plain {column: value} rows of OPTIONS_TOP_COLUMNS (options payloads carry no DataFrames)"""
+    return frame[OPTIONS_TOP_COLUMNS].to_dict("records")  # type: ignore[no-any-return]
+
+
+def _top_rows(frame: Any, values: Any, n: int = OPTIONS_TOP_N) -> list[dict[str, Any]]:  # noqa: ANN401
+    """
+    Records of the same rows, in the same order, as frame.nlargest(n, col) for col's values
+
+    O(N) selection of the n largest non-NaN values instead of a full sort; ties at
+    the cut-off and within the result keep chain order, like nlargest(keep="first"),
+    and short results are padded with NaN rows the same way.
+    """
+    missing = np.isnan(values)
+    rows = np.flatnonzero(~missing)
+    if len(rows) > n:
+        candidates = values[rows]
+        cutoff = np.partition(candidates, len(rows) - n)[len(rows) - n]  # n-th largest
+        above = rows[candidates > cutoff]
+        rows = np.concatenate([above, rows[candidates == cutoff][: n - len(above)]])
+    rows = rows[np.lexsort((rows, -values[rows]))]
+    if len(rows) < n:  # nlargest pads short results with NaN rows, in chain order
+        rows = np.concatenate([rows, np.flatnonzero(missing)[: n - len(rows)]])
+    return _option_records(frame.iloc[rows])
+
+
+def _mean_iv_pct(iv: Any, fallback: float) -> float:  # noqa: ANN401
+    """Mean implied volatility in percent (NaN-skipping); fallback when no strikes qualify"""
+    if len(iv) == 0:
+        return fallback
+    iv = iv[~np.isnan(iv)]
+    return float(iv.mean() * 100) if len(iv) > 0 else math.nan
+
+
+def get_options_data(  # noqa: PLR0915, PLR0912
+    symbol: str,
+    expiration: str = "nearest",
+    include_all_expirations: bool = True,
+) -> dict[str, Any]:
     """
     Fetch options chain data for a symbol.
 
     Args:
         symbol: Ticker symbol (e.g., 'PALL', 'AAPL')
         expiration: 'nearest' or specific date like '2025-11-21'
+        include_all_expirations: Fetch every expiration's chain for the term structure
+            and all-expirations summary. False fetches only the selected chain
+            (both come back empty) - for callers that show positioning only
 
     Returns:
         dict with options positioning, IV structure, term structure
     """
-    symbol = normalize_ticker_symbol(symbol)
     try:
-        ticker = yf.Ticker(symbol)
+        symbol = normalize_ticker_symbol(symbol)
+        ticker = get_ticker(symbol)
 
         # Get available expiration dates
         expirations = ticker.options  # List of date strings
@@ -1612,8 +2163,27 @@ def get_options_data(symbol: str, expiration: str = "nearest") -> dict[str, Any]
         if exp_date not in expirations:
             return {"error": f"Expiration {expiration} not available"}
 
-        # Fetch option chain
-        chain = ticker.option_chain(exp_date)
+        # Fetch every expiration's chain concurrently, once - the selected expiration,
+        # term structure and all-expirations summary all read from this dict
+        summary_expirations = expirations if include_all_expirations else []
+        def fetch_chain(exp: str) -> Any:  # noqa: ANN401
+            try:
+                # Concurrent options() calls for the same symbol share each chain fetch
+                return _coalesce(
+                    ("option_chain", f"{symbol}:{exp}"),
+                    lambda: get_option_chain(symbol, exp, ticker),
+                )
+            except Exception:
+                return None
+
+        fetch_expirations = summary_expirations or [exp_date]
+        chains = dict(
+            zip(fetch_expirations, LOOKUP_EXECUTOR.map(fetch_chain, fetch_expirations), strict=True)
+        )
+
+        chain = chains[exp_date]
+        if chain is None:
+            return {"error": f"No options data available for {symbol} expiration {exp_date}"}
         calls = chain.calls
         puts = chain.puts
 
@@ -1621,122 +2191,79 @@ def get_options_data(symbol: str, expiration: str = "nearest") -> dict[str, Any]
         if calls.empty or puts.empty:
             return {"error": f"No options data available for {symbol} expiration {exp_date}"}
 
-        # Fill NaN volumes with 0 (some illiquid options have NaN volume)
-        calls["volume"] = calls["volume"].fillna(0)
-        puts["volume"] = puts["volume"].fillna(0)
+        # One clock read for every DTE and the timestamp; expirations parsed once
+        # (fromisoformat, not strptime) into days-to-expiration from ET midnight
+        now = datetime.now(_ET)
+        dte_by_exp = {
+            exp: (datetime.fromisoformat(exp).replace(tzinfo=_ET) - now).days
+            for exp in expirations
+        }
 
         # Current price (for ATM calculation)
-        current_price = ticker.fast_info.get("lastPrice", 0)
+        current_price = get_fast_info(symbol, ticker).get("lastPrice", 0)
+
+        # Pull each chain column out as an ndarray once; every positioning metric
+        # below is a masked reduction over these instead of another DataFrame pass
+        c_strike, c_oi, c_vol, c_iv = _chain_arrays(calls)
+        p_strike, p_oi, p_vol, p_iv = _chain_arrays(puts)
 
         # Calculate positioning metrics
-        call_oi_total = int(calls["openInterest"].sum())
-        put_oi_total = int(puts["openInterest"].sum())
+        call_oi_total = int(np.nansum(c_oi))
+        put_oi_total = int(np.nansum(p_oi))
         pc_ratio_oi = put_oi_total / call_oi_total if call_oi_total > 0 else 0
 
-        call_volume_total = int(calls["volume"].sum())
-        put_volume_total = int(puts["volume"].sum())
+        call_volume_total = int(np.nansum(c_vol))
+        put_volume_total = int(np.nansum(p_vol))
         pc_ratio_vol = put_volume_total / call_volume_total if call_volume_total > 0 else 0
 
         # Find ATM strike (closest to current price)
-        atm_strike = calls["strike"].iloc[(calls["strike"] - current_price).abs().argsort()[0]]
+        atm_strike = _atm_strike(calls["strike"], current_price)
 
         # Get ATM IV
         atm_call_row = calls[calls["strike"] == atm_strike]
         atm_put_row = puts[puts["strike"] == atm_strike]
 
-        atm_call_iv = float(atm_call_row["impliedVolatility"].values[0] * 100)
-        atm_put_iv = float(atm_put_row["impliedVolatility"].values[0] * 100)
-
-        # Top positions by OI (expand to 10)
-        top_calls_oi = calls.nlargest(10, "openInterest")[
-            ["strike", "openInterest", "volume", "lastPrice", "impliedVolatility"]
-        ].copy()
-        top_puts_oi = puts.nlargest(10, "openInterest")[
-            ["strike", "openInterest", "volume", "lastPrice", "impliedVolatility"]
-        ].copy()
-
-        # Top positions by volume
-        top_calls_vol = calls.nlargest(10, "volume")[
-            ["strike", "openInterest", "volume", "lastPrice", "impliedVolatility"]
-        ].copy()
-        top_puts_vol = puts.nlargest(10, "volume")[
-            ["strike", "openInterest", "volume", "lastPrice", "impliedVolatility"]
-        ].copy()
+        atm_call_iv = float(atm_call_row["impliedVolatility"].iat[0] * 100)
+        atm_put_iv = float(atm_put_row["impliedVolatility"].iat[0] * 100)
+
+        # Top positions by OI (expand to 10) and by volume
+        top_calls_oi = _top_rows(calls, c_oi)
+        top_puts_oi = _top_rows(puts, p_oi)
+        top_calls_vol = _top_rows(calls, c_vol)
+        top_puts_vol = _top_rows(puts, p_vol)
 
         # ITM vs OTM breakdown
-        calls_itm = calls[calls["strike"] < current_price]
-        calls_otm = calls[calls["strike"] >= current_price]
-        puts_itm = puts[puts["strike"] > current_price]
-        puts_otm = puts[puts["strike"] <= current_price]
+        calls_itm = c_strike < current_price
+        puts_itm = p_strike > current_price
 
-        call_oi_itm = int(calls_itm["openInterest"].sum())
-        call_oi_otm = int(calls_otm["openInterest"].sum())
-        put_oi_itm = int(puts_itm["openInterest"].sum())
-        put_oi_otm = int(puts_otm["openInterest"].sum())
+        call_oi_itm = int(np.nansum(c_oi[calls_itm]))
+        call_oi_otm = int(np.nansum(c_oi[~calls_itm]))
+        put_oi_itm = int(np.nansum(p_oi[puts_itm]))
+        put_oi_otm = int(np.nansum(p_oi[~puts_itm]))
 
         # Vol skew (OTM vs ATM)
-        otm_put_strikes = puts[puts["strike"] < current_price * 0.9]
-        otm_call_strikes = calls[calls["strike"] > current_price * 1.1]
-
-        otm_put_iv_avg = (
-            float(otm_put_strikes["impliedVolatility"].mean() * 100)
-            if len(otm_put_strikes) > 0
-            else atm_put_iv
-        )
-        otm_call_iv_avg = (
-            float(otm_call_strikes["impliedVolatility"].mean() * 100)
-            if len(otm_call_strikes) > 0
-            else atm_call_iv
-        )
+        otm_put_iv_avg = _mean_iv_pct(p_iv[p_strike < current_price * 0.9], atm_put_iv)
+        otm_call_iv_avg = _mean_iv_pct(c_iv[c_strike > current_price * 1.1], atm_call_iv)
 
         put_skew = otm_put_iv_avg - atm_put_iv
         call_skew = otm_call_iv_avg - atm_call_iv
 
-        # Term structure (if multiple expirations available)
-        term_structure = []
-        if len(expirations) >= 3:  # noqa: PLR2004
-            for exp in expirations[:3]:  # Near, mid, far
-                chain_exp = ticker.option_chain(exp)
-                calls_exp = chain_exp.calls
-                atm_exp = calls_exp["strike"].iloc[
-                    (calls_exp["strike"] - current_price).abs().argsort()[0]
-                ]
-                atm_row_exp = calls_exp[calls_exp["strike"] == atm_exp]
-                iv_exp = float(atm_row_exp["impliedVolatility"].values[0] * 100)
-
-                # Days to expiration
-                exp_datetime = datetime.strptime(exp, "%Y-%m-%d").replace(
-                    tzinfo=ZoneInfo("America/New_York")
-                )
-                now = datetime.now(ZoneInfo("America/New_York"))
-                dte = (exp_datetime - now).days
-
-                term_structure.append({"expiration": exp, "dte": dte, "iv": iv_exp})
-
-        contango = (
-            term_structure[0]["iv"] - term_structure[-1]["iv"]
-            if len(term_structure) >= 2  # noqa: PLR2004
-            else 0
-        )
-
-        # All expirations summary
+        # All expirations summary, plus the near/mid/far term structure
+        # (first 3 expirations, when at least 3 are listed) from the same pass
         all_expirations = []
-        for exp in expirations:
+        term_structure = []
+        for exp_idx, exp in enumerate(summary_expirations):
+            chain_exp = chains[exp]
+            if chain_exp is None:
+                continue
             try:
-                chain_exp = ticker.option_chain(exp)
                 calls_exp = chain_exp.calls
                 puts_exp = chain_exp.puts
 
-                # Fill NaN volumes with 0
-                calls_exp["volume"] = calls_exp["volume"].fillna(0)
-                puts_exp["volume"] = puts_exp["volume"].fillna(0)
-
                 # ATM IV for this expiration
-                atm_exp = calls_exp["strike"].iloc[
-                    (calls_exp["strike"] - current_price).abs().argsort()[0]
-                ]
+                atm_exp = _atm_strike(calls_exp["strike"], current_price)
                 atm_row_exp = calls_exp[calls_exp["strike"] == atm_exp]
-                iv_exp = float(atm_row_exp["impliedVolatility"].values[0] * 100)
+                iv_exp = float(atm_row_exp["impliedVolatility"].iat[0] * 100)
 
                 # OI for this expiration
                 call_oi_exp = int(calls_exp["openInterest"].sum())
@@ -1749,11 +2276,7 @@ def get_options_data(symbol: str, expiration: str = "nearest") -> dict[str, Any]
                 total_vol_exp = call_vol_exp + put_vol_exp
 
                 # DTE
-                exp_datetime = datetime.strptime(exp, "%Y-%m-%d").replace(
-                    tzinfo=ZoneInfo("America/New_York")
-                )
-                now = datetime.now(ZoneInfo("America/New_York"))
-                dte_exp = (exp_datetime - now).days
+                dte_exp = dte_by_exp[exp]
 
                 all_expirations.append({
                     "expiration": exp,
@@ -1764,78 +2287,73 @@ def get_options_data(symbol: str, expiration: str = "nearest") -> dict[str, Any]
                     "call_oi": call_oi_exp,
                     "put_oi": put_oi_exp,
                 })
+                if len(expirations) >= 3 and exp_idx < 3:  # noqa: PLR2004
+                    term_structure.append({"expiration": exp, "dte": dte_exp, "iv": iv_exp})
             except Exception:
                 continue
 
+        contango = (
+            term_structure[0]["iv"] - term_structure[-1]["iv"]
+            if len(term_structure) >= 2  # noqa: PLR2004
+            else 0
+        )
+
         # Max pain calculation (strike with most option seller pain)
         # Max pain = strike where sum of (calls ITM value + puts ITM value) is minimized
-        max_pain_strike = 0
-        min_pain_value = float("inf")
-
-        for strike in sorted(set(calls["strike"]) | set(puts["strike"])):
-            # Calculate pain for this strike
-            call_pain = sum(
-                max(0, strike - c_strike) * c_oi
-                for c_strike, c_oi in zip(calls["strike"], calls["openInterest"], strict=False)
-                if c_strike < strike
-            )
-            put_pain = sum(
-                max(0, p_strike - strike) * p_oi
-                for p_strike, p_oi in zip(puts["strike"], puts["openInterest"], strict=False)
-                if p_strike > strike
-            )
-            total_pain = call_pain + put_pain
-
-            if total_pain < min_pain_value:
-                min_pain_value = total_pain
-                max_pain_strike = strike
+        max_pain_strike = calculate_max_pain(
+            calls["strike"], calls["openInterest"], puts["strike"], puts["openInterest"]
+        )
 
         # Unusual activity detection (volume >> OI)
-        unusual_calls = calls[calls["volume"] > calls["openInterest"] * 2]
-        unusual_puts = puts[puts["volume"] > puts["openInterest"] * 2]
-        unusual_activity = len(unusual_calls) + len(unusual_puts) > 0
+        # Masks over the column arrays; rows are only materialized when a side has any
+        unusual_call_mask = c_vol > c_oi * 2
+        unusual_put_mask = p_vol > p_oi * 2
+        unusual_calls = _option_records(calls[unusual_call_mask]) if unusual_call_mask.any() else []
+        unusual_puts = _option_records(puts[unusual_put_mask]) if unusual_put_mask.any() else []
+        unusual_activity = bool(unusual_call_mask.any() or unusual_put_mask.any())
 
         # Historical IV (last 30 days) for IV rank/percentile
         # Fetch historical volatility data
         hist_iv_data = None
         try:
-            hist = ticker.history(period="3mo", interval="1d")
+            # One 1y fetch serves both windows - the 3mo window is its tail
+            hist_1y = ticker.history(period="1y", interval="1d")
+            hist = hist_1y.iloc[-OPTIONS_HIST_3MO_SESSIONS:]
             if not hist.empty and len(hist) >= 30:  # noqa: PLR2004
                 # Calculate 30-day historical volatility
                 returns = hist["Close"].pct_change().dropna()
                 hist_vol_30d = float(returns.std() * (252 ** 0.5) * 100)
 
                 # Calculate 52-week IV range (approximate from historical vol)
-                hist_90d = ticker.history(period="1y", interval="1d")
-                if not hist_90d.empty:
-                    returns_1y = hist_90d["Close"].pct_change().dropna()
-                    # Rolling 30-day volatility over 1 year
-                    rolling_vol = returns_1y.rolling(30).std() * (252 ** 0.5) * 100
+                returns_1y = hist_1y["Close"].pct_change().dropna().to_numpy(dtype=np.float64)
+                # Rolling 30-day volatility over 1 year: one std over a strided window view
+                if len(returns_1y) >= OPTIONS_VOL_WINDOW:
+                    rolling_vol = (
+                        sliding_window_view(returns_1y, OPTIONS_VOL_WINDOW).std(axis=1, ddof=1)
+                        * ANNUALIZED_VOL_PCT
+                    )
                     iv_high_52w = float(rolling_vol.max())
                     iv_low_52w = float(rolling_vol.min())
+                else:
+                    iv_high_52w = iv_low_52w = math.nan
 
-                    # IV rank (where current IV sits in 52-week range)
-                    iv_rank = ((atm_call_iv - iv_low_52w) / (iv_high_52w - iv_low_52w) * 100
-                               if iv_high_52w > iv_low_52w else 50)
+                # IV rank (where current IV sits in 52-week range)
+                iv_rank = ((atm_call_iv - iv_low_52w) / (iv_high_52w - iv_low_52w) * 100
+                           if iv_high_52w > iv_low_52w else 50)
 
-                    hist_iv_data = {
-                        "hist_vol_30d": hist_vol_30d,
-                        "iv_high_52w": iv_high_52w,
-                        "iv_low_52w": iv_low_52w,
-                        "iv_rank": iv_rank,
-                    }
+                hist_iv_data = {
+                    "hist_vol_30d": hist_vol_30d,
+                    "iv_high_52w": iv_high_52w,
+                    "iv_low_52w": iv_low_52w,
+                    "iv_rank": iv_rank,
+                }
         except Exception:
             pass
 
         # Days to expiration
-        exp_datetime = datetime.strptime(exp_date, "%Y-%m-%d").replace(
-            tzinfo=ZoneInfo("America/New_York")
-        )
-        now = datetime.now(ZoneInfo("America/New_York"))
-        dte = (exp_datetime - now).days
+        dte = dte_by_exp[exp_date]
 
         # Timestamp
-        now = datetime.now(ZoneInfo("America/New_York"))
         timestamp = now.strftime("%Y-%m-%d %H:%M %Z")
 
         return {
@@ -1951,7 +2469,7 @@ def format_options(data: dict[str, Any]) -> str:  # noqa: PLR0915, PLR0912
     for i in range(min(max_rows, 10)):
         call_line = ""
         if i < len(top_calls_oi):
-            c = top_calls_oi.iloc[i]
+            c = top_calls_oi[i]
             strike = c["strike"]
             oi = int(c["openInterest"])
             vol = int(c["volume"])
@@ -1961,7 +2479,7 @@ def format_options(data: dict[str, Any]) -> str:  # noqa: PLR0915, PLR0912
 
         put_line = ""
         if i < len(top_puts_oi):
-            p = top_puts_oi.iloc[i]
+            p = top_puts_oi[i]
             strike = p["strike"]
             oi = int(p["openInterest"])
             vol = int(p["volume"])
@@ -2132,7 +2650,7 @@ def format_options(data: dict[str, Any]) -> str:  # noqa: PLR0915, PLR0912
         # Show top 3 unusual strikes
         if len(unusual_calls) > 0:
             lines.append("Top Unusual Calls:")
-            for _, row in unusual_calls.nlargest(3, "volume").iterrows():
+            for row in sorted(unusual_calls, key=itemgetter("volume"), reverse=True)[:3]:
                 strike = row["strike"]
                 vol = int(row["volume"])
                 oi = int(row["openInterest"])
@@ -2141,7 +2659,7 @@ def format_options(data: dict[str, Any]) -> str:  # noqa: PLR0915, PLR0912
                 lines.append(f"  ${strike:.0f}  Vol:{vol:,}  OI:{oi:,}  Ratio:{ratio_str}")
         if len(unusual_puts) > 0:
             lines.append("Top Unusual Puts:")
-            for _, row in unusual_puts.nlargest(3, "volume").iterrows():
+            for row in sorted(unusual_puts, key=itemgetter("volume"), reverse=True)[:3]:
                 strike = row["strike"]
                 vol = int(row["volume"])
                 oi = int(row["openInterest"])
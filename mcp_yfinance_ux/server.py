@@ -18,25 +18,13 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
-from .market_data import (
-    format_markets,
-    format_options,
-    format_sector,
-    format_ticker,
-    format_ticker_batch,
-    get_markets_data,
-    get_options_data,
-    get_sector_data,
-    get_ticker_screen_data,
-    get_ticker_screen_data_batch,
-)
-from .tools import get_mcp_tools
+from .tools import get_mcp_tools, run_tool
 
 app = Server("yfinance-mcp")
 
 
 @app.list_tools()  # type: ignore[misc,no-untyped-call]
-async def list_tools() -> list[Tool]:
+async def list_tools() -> tuple[Tool, ...]:
     """List available MCP tools - imported from tools.py (single source of truth)"""
     return get_mcp_tools()
 
@@ -45,51 +33,8 @@ async def list_tools() -> list[Tool]:
 
 @app.call_tool()  # type: ignore[misc]
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:  # noqa: ANN401
-    """Handle tool execution - thin wrapper around core business logic"""
-    if name == "markets":
-        data = get_markets_data()
-        formatted = format_markets(data)
-        return [TextContent(type="text", text=formatted)]
-
-    if name == "sector":
-        sector_name = arguments.get("name")
-        if not sector_name:
-            msg = "sector() requires 'name' parameter"
-            raise ValueError(msg)
-        data = get_sector_data(sector_name)
-        formatted = format_sector(data)
-        return [TextContent(type="text", text=formatted)]
-
-    if name == "ticker":
-        symbol = arguments.get("symbol")
-        if not symbol:
-            msg = "ticker() requires 'symbol' parameter"
-            raise ValueError(msg)
-
-        # Check if batch mode (list) or single mode (string)
-        if isinstance(symbol, list):
-            # Batch comparison mode - use batch API to avoid hammering Yahoo
-            data_list = get_ticker_screen_data_batch(symbol)
-            formatted = format_ticker_batch(data_list)
-            return [TextContent(type="text", text=formatted)]
-
-        # Single ticker mode
-        data = get_ticker_screen_data(symbol)
-        formatted = format_ticker(data)
-        return [TextContent(type="text", text=formatted)]
-
-    if name == "ticker_options":
-        symbol = arguments.get("symbol")
-        if not symbol:
-            msg = "ticker_options() requires 'symbol' parameter"
-            raise ValueError(msg)
-        expiration = arguments.get("expiration", "nearest")
-        data = get_options_data(symbol, expiration)
-        formatted = format_options(data)
-        return [TextContent(type="text", text=formatted)]
-
-    msg = f"Unknown tool: {name}"
-    raise ValueError(msg)
+    """Handle tool execution - thin wrapper around tools.run_tool dispatch"""
+    return [TextContent(type="text", text=await run_tool(name, arguments))]
 
 
 async def main() -> None:
@@ -102,5 +47,15 @@ async def main() -> None:
         )
 
 
+def run() -> None:
+    """Run main() on uvloop (C event loop) when installed, else the stock asyncio loop"""
+    try:
+        import uvloop  # type: ignore[import-not-found,unused-ignore]  # noqa: PLC0415
+    except ImportError:
+        asyncio.run(main())
+        return
+    uvloop.run(main())
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()
@@ -6,13 +6,24 @@ Network server for multi-tenant Claude Code access.
 Same MCP protocol as stdio server, different transport.
 
 Run with: make server
+(uvicorn's default loop/http "auto" picks uvloop + httptools when installed)
 
 Configuration:
 - PORT: Server port (default: 5001)
+- MCP_LOG_LEVEL: Log level (default: INFO; DEBUG traces every tool call)
+- MCP_MAX_SSE: Max concurrent SSE connections (default: 64; extra clients get 503)
 """
 
+import asyncio
+import atexit
+import json
+import logging
 import os
+import queue
 import signal
+import time
+from functools import partial
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
 from mcp.server import Server
@@ -20,25 +31,15 @@ from mcp.server.sse import SseServerTransport
 from mcp.types import TextContent, Tool
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import Response
 from starlette.routing import Mount, Route
 
-from .market_data import (
-    format_markets,
-    format_options,
-    format_sector,
-    format_ticker,
-    format_ticker_batch,
-    get_markets_data,
-    get_options_data,
-    get_sector_data,
-    get_ticker_screen_data,
-    get_ticker_screen_data_batch,
-)
-from .tools import get_mcp_tools
+from .tools import get_mcp_tools, run_tool
 
 # Configuration
 DEFAULT_PORT = 5001
+DEFAULT_LOG_LEVEL = "INFO"
+DEFAULT_MAX_SSE = 64
 
 
 def get_port() -> int:
@@ -51,6 +52,45 @@ def get_port() -> int:
         raise ValueError(msg) from None
 
 
+def _parse_max_sse() -> int:
+    """Parse SSE connection cap from environment or use default"""
+    max_str = os.environ.get("MCP_MAX_SSE", str(DEFAULT_MAX_SSE))
+    try:
+        return int(max_str)
+    except ValueError:
+        msg = f"Invalid MCP_MAX_SSE value: {max_str}"
+        raise ValueError(msg) from None
+
+
+# Read once at import - checked on every SSE connect
+MAX_SSE_CONNECTIONS = _parse_max_sse()
+
+
+def _configure_logging() -> logging.Logger:
+    """
+    Server logger writing through a QueueHandler
+
+    Request handlers only enqueue records; a background QueueListener does the
+    formatting and stream writes, so log I/O stays off the event loop. %-style
+    arguments are only formatted when the level is enabled.
+    """
+    server_logger = logging.getLogger("mcp_yfinance_ux.server")
+    server_logger.setLevel(os.environ.get("MCP_LOG_LEVEL", DEFAULT_LOG_LEVEL).upper())
+    server_logger.propagate = False
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("[MCP-SERVER] %(message)s"))
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    server_logger.addHandler(QueueHandler(log_queue))
+    return server_logger
+
+
+logger = _configure_logging()
+
 # MCP Server instance (reuses same logic as stdio server)
 mcp_server = Server("yfinance-mcp")
 
@@ -59,87 +99,112 @@ sse_transport = SseServerTransport("/messages")
 
 
 @mcp_server.list_tools()  # type: ignore[misc,no-untyped-call]
-async def list_tools() -> list[Tool]:
+async def list_tools() -> tuple[Tool, ...]:
     """List available MCP tools - imported from tools.py (single source of truth)"""
     return get_mcp_tools()
 
 
+# Formatted tool responses, shared across SSE clients for the same (tool, arguments).
+# Matches the 10s Cache-Control on /sse: N clients asking for markets() inside the
+# window cost one Yahoo round-trip. Single event loop - no locks needed.
+RESPONSE_CACHE_TTL_SECONDS = 10.0
+RESPONSE_CACHE_MAX_ENTRIES = 512
 
+_RESPONSE_CACHE: dict[tuple[Any, ...], tuple[float, str]] = {}  # key -> (expires_at, text)
+_RESPONSE_INFLIGHT: dict[tuple[Any, ...], asyncio.Task[str]] = {}
 
-@mcp_server.call_tool()  # type: ignore[misc]
-async def call_tool(name: str, arguments: Any) -> list[TextContent]:  # noqa: ANN401
-    """Handle tool execution - thin wrapper around core business logic"""
-    print(f"[MCP-SERVER] call_tool: name={name}, arguments={arguments}", flush=True)
 
-    if name == "markets":
-        data = get_markets_data()
-        formatted = format_markets(data)
-        print(f"[MCP-SERVER] markets() returning {len(formatted)} chars", flush=True)
-        return [TextContent(type="text", text=formatted)]
+def _response_key(name: str, arguments: Any) -> tuple[Any, ...]:  # noqa: ANN401
+    """
+    Fixed-shape cache key per tool - a flat tuple, cheap to build and hash
 
+    Only the parameters each tool reads are part of its key (extra arguments are
+    ignored, as in tools.run_tool); batch ticker keys keep the caller's order,
+    which is the row order of the screen.
+    """
     if name == "sector":
-        sector_name = arguments.get("name")
-        if not sector_name:
-            msg = "sector() requires 'name' parameter"
-            raise ValueError(msg)
-        data = get_sector_data(sector_name)
-        formatted = format_sector(data)
-        print(f"[MCP-SERVER] sector({sector_name}) returning {len(formatted)} chars", flush=True)
-        return [TextContent(type="text", text=formatted)]
-
+        return (name, arguments.get("name"))
     if name == "ticker":
         symbol = arguments.get("symbol")
-        if not symbol:
-            msg = "ticker() requires 'symbol' parameter"
-            raise ValueError(msg)
-
-        # Check if batch mode (list) or single mode (string)
         if isinstance(symbol, list):
-            # Batch comparison mode - use batch API to avoid hammering Yahoo
-            data_list = get_ticker_screen_data_batch(symbol)
-            formatted = format_ticker_batch(data_list)
-            print(
-                f"[MCP-SERVER] ticker({symbol}) batch returning {len(formatted)} chars",
-                flush=True
-            )
-            return [TextContent(type="text", text=formatted)]
+            return ("ticker_batch", *symbol)
+        return (name, symbol)
+    if name == "ticker_options":
+        return (name, arguments.get("symbol"), arguments.get("expiration", "nearest"))
+    return (name,)
 
-        # Single ticker mode
-        data = get_ticker_screen_data(symbol)
-        formatted = format_ticker(data)
-        print(f"[MCP-SERVER] ticker({symbol}) returning {len(formatted)} chars", flush=True)
-        return [TextContent(type="text", text=formatted)]
 
-    if name == "ticker_options":
-        symbol = arguments.get("symbol")
-        if not symbol:
-            msg = "ticker_options() requires 'symbol' parameter"
-            raise ValueError(msg)
-        expiration = arguments.get("expiration", "nearest")
-        data = get_options_data(symbol, expiration)
-        formatted = format_options(data)
-        print(
-            f"[MCP-SERVER] ticker_options({symbol}, {expiration}) returning {len(formatted)} chars",
-            flush=True
-        )
-        return [TextContent(type="text", text=formatted)]
+def _store_response(key: tuple[Any, ...], task: asyncio.Task[str]) -> None:
+    """Done-callback: retire the in-flight task and cache its text (errors aren't cached)"""
+    _RESPONSE_INFLIGHT.pop(key, None)
+    if task.cancelled() or task.exception() is not None:
+        return
+    now = time.monotonic()
+    if len(_RESPONSE_CACHE) >= RESPONSE_CACHE_MAX_ENTRIES:
+        for stale in [k for k, (expires_at, _) in _RESPONSE_CACHE.items() if expires_at <= now]:
+            del _RESPONSE_CACHE[stale]
+        if len(_RESPONSE_CACHE) >= RESPONSE_CACHE_MAX_ENTRIES:
+            _RESPONSE_CACHE.pop(next(iter(_RESPONSE_CACHE)))  # Oldest insert
+    _RESPONSE_CACHE[key] = (now + RESPONSE_CACHE_TTL_SECONDS, task.result())
+
+
+async def _cached_response(name: str, arguments: Any) -> str:  # noqa: ANN401
+    """
+    Formatted text for a tool call, from cache when fresh
+
+    Concurrent misses for the same key await one shared task (stampede protection);
+    shield() keeps a disconnecting client from cancelling it for the others.
+    """
+    key = _response_key(name, arguments)
+    entry = _RESPONSE_CACHE.get(key)
+    if entry is not None and time.monotonic() < entry[0]:
+        return entry[1]
 
-    msg = f"Unknown tool: {name}"
-    raise ValueError(msg)
+    task = _RESPONSE_INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(run_tool(name, arguments))
+        _RESPONSE_INFLIGHT[key] = task
+        task.add_done_callback(partial(_store_response, key))
+    return await asyncio.shield(task)
+
+
+@mcp_server.call_tool()  # type: ignore[misc]
+async def call_tool(name: str, arguments: Any) -> list[TextContent]:  # noqa: ANN401
+    """Handle tool execution - thin wrapper around core business logic"""
+    logger.debug("call_tool: name=%s, arguments=%s", name, arguments)
+    formatted = await _cached_response(name, arguments)
+    logger.debug("%s returning %d chars", name, len(formatted))
+    return [TextContent(type="text", text=formatted)]
 
 
 # Starlette endpoint handlers
 
-async def handle_ping(_request: Request) -> JSONResponse:
+# Constant bodies, encoded once (same compact JSON JSONResponse would render) -
+# the health check is polled constantly and does no serialization per request
+_PING_BODY = json.dumps({"status": "ok"}, separators=(",", ":")).encode()
+_SHUTDOWN_BODY = json.dumps({"status": "shutting down"}, separators=(",", ":")).encode()
+
+# The whole /ping response is static: built once (headers included) and replayed -
+# a Response holds no per-request state. no-store keeps probes from seeing a cached "ok"
+_PING_RESPONSE = Response(
+    _PING_BODY, media_type="application/json", headers={"Cache-Control": "no-store"}
+)
+
+
+async def handle_ping(_request: Request) -> Response:
     """Health check endpoint"""
-    return JSONResponse({"status": "ok"})
+    return _PING_RESPONSE
 
 
-async def handle_shutdown(_request: Request) -> JSONResponse:
+async def handle_shutdown(_request: Request) -> Response:
     """Graceful shutdown endpoint"""
     # Send SIGTERM to self for graceful shutdown
     os.kill(os.getpid(), signal.SIGTERM)
-    return JSONResponse({"status": "shutting down"})
+    return Response(_SHUTDOWN_BODY, media_type="application/json")
+
+
+# Open SSE connections (queue-depth metric for the cap above)
+_active_sse = 0
 
 
 async def handle_sse(request: Request) -> Response:
@@ -149,17 +214,39 @@ async def handle_sse(request: Request) -> Response:
     Creates a new SSE connection for each client, runs the MCP server
     with the connection streams, and returns when client disconnects.
     """
+    global _active_sse  # noqa: PLW0603
     client_addr = request.client.host if request.client else "unknown"
-    print(f"[MCP-SERVER] New SSE connection from {client_addr}", flush=True)
-
-    async with sse_transport.connect_sse(
-        request.scope, request.receive, request._send
-    ) as streams:
-        print("[MCP-SERVER] SSE connected, running MCP server loop", flush=True)
-        await mcp_server.run(
-            streams[0], streams[1], mcp_server.create_initialization_options()
+
+    # Backpressure: each connection runs a full MCP loop; past the cap, shed load
+    # instead of slowing every client down. Check+increment has no await between
+    # them, so the counter is race-free on the single event loop
+    if _active_sse >= MAX_SSE_CONNECTIONS:
+        logger.warning(
+            "Rejecting SSE connection from %s (%d/%d active)",
+            client_addr,
+            _active_sse,
+            MAX_SSE_CONNECTIONS,
         )
-        print(f"[MCP-SERVER] SSE disconnected from {client_addr}", flush=True)
+        return Response(status_code=503, headers={"Retry-After": "1"})
+
+    _active_sse += 1
+    logger.info(
+        "New SSE connection from %s (%d/%d active)",
+        client_addr,
+        _active_sse,
+        MAX_SSE_CONNECTIONS,
+    )
+    try:
+        async with sse_transport.connect_sse(
+            request.scope, request.receive, request._send
+        ) as streams:
+            logger.info("SSE connected, running MCP server loop")
+            await mcp_server.run(
+                streams[0], streams[1], mcp_server.create_initialization_options()
+            )
+            logger.info("SSE disconnected from %s", client_addr)
+    finally:
+        _active_sse -= 1
 
     # Return empty response to avoid NoneType error (per MCP docs)
     # Add cache headers: 10 seconds for market data (5-10s range)
@@ -2,24 +2,84 @@
 """
 MCP Tool Definitions - Single Source of Truth
 
-Tool definitions shared between server.py (stdio) and server_http.py (SSE/HTTP).
-Define tools once, import everywhere.
+Tool definitions and dispatch shared between server.py (stdio) and
+server_http.py (SSE/HTTP). Define tools once, import everywhere.
 """
 
-from mcp.types import Tool
-
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
 
-def get_mcp_tools() -> list[Tool]:
-    """
-    Return list of MCP tools.
+from mcp.types import Tool
 
-    Single source of truth for tool definitions.
-    Both stdio and HTTP servers import this function.
-    """
-    return [
-        Tool(
+# Shared description boilerplate - one string object referenced by every tool
+_OUTPUT_FORMAT_LINE = "Output: BBG Lite formatted text (dense, scannable, professional)."
+
+# Input schemas - module constants, shared by reference (treat as read-only)
+_MARKETS_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {},
+    "required": []
+}
+
+_SECTOR_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "name": {
+            "type": "string",
+            "description": (
+                "Sector name (e.g., 'technology', 'financials', "
+                "'healthcare', 'energy', 'consumer discretionary', "
+                "'consumer staples', 'industrials', 'utilities', "
+                "'materials', 'real estate', 'communication')"
+            ),
+        }
+    },
+    "required": ["name"]
+}
+
+_TICKER_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "symbol": {
+            "oneOf": [
+                {"type": "string"},
+                {"type": "array", "items": {"type": "string"}}
+            ],
+            "description": (
+                "Ticker symbol or list of symbols "
+                "(e.g., 'TSLA' or ['TSLA', 'F', 'GM'])"
+            ),
+        }
+    },
+    "required": ["symbol"]
+}
+
+_TICKER_OPTIONS_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "symbol": {
+            "type": "string",
+            "description": "Ticker symbol (e.g., 'PALL', 'AAPL')",
+        },
+        "expiration": {
+            "type": "string",
+            "description": "Expiration date: 'nearest' (default) or 'YYYY-MM-DD'",
+            "default": "nearest",
+        }
+    },
+    "required": ["symbol"]
+}
+
+
+def _build_mcp_tools() -> tuple[Tool, ...]:
+    """Build the MCP tool definitions (called once, at import)"""
+    # Trusted static data - validation unnecessary. model_construct skips pydantic's
+    # validate/coerce pass; fields and defaults come out identical to Tool(...)
+    return (
+        Tool.model_construct(
             name="markets",
-            description="""
+            description=f"""
 Market overview screen - complete factor landscape.
 
 Shows:
@@ -32,19 +92,15 @@ Shows:
 
 All with momentum (1M, 1Y trailing returns).
 
-Output: BBG Lite formatted text (dense, scannable, professional).
+{_OUTPUT_FORMAT_LINE}
 
 Navigation: Drill down with sector('technology') or ticker('AAPL')
 """,
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
+            inputSchema=_MARKETS_SCHEMA,
         ),
-        Tool(
+        Tool.model_construct(
             name="sector",
-            description="""
+            description=f"""
 Sector drill-down screen - detailed sector analysis.
 
 Shows:
@@ -60,27 +116,13 @@ Accepts both display names and normalized names:
 - 'consumer discretionary' or 'consumer_disc'
 - 'consumer staples' or 'consumer_stpl'
 
-Output: BBG Lite formatted text (dense, scannable, professional).
+{_OUTPUT_FORMAT_LINE}
 """,
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": (
-                            "Sector name (e.g., 'technology', 'financials', "
-                            "'healthcare', 'energy', 'consumer discretionary', "
-                            "'consumer staples', 'industrials', 'utilities', "
-                            "'materials', 'real estate', 'communication')"
-                        ),
-                    }
-                },
-                "required": ["name"]
-            }
+            inputSchema=_SECTOR_SCHEMA,
         ),
-        Tool(
+        Tool.model_construct(
             name="ticker",
-            description="""
+            description=f"""
 Individual security screen - complete factor analysis.
 
 SINGLE TICKER MODE:
@@ -130,28 +172,13 @@ Nearest Exp:  2025-11-21 (23d)
 
 For full analysis: ticker_options('TSLA')
 
-Output: BBG Lite formatted text (dense, scannable, professional).
+{_OUTPUT_FORMAT_LINE}
 """,
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {
-                        "oneOf": [
-                            {"type": "string"},
-                            {"type": "array", "items": {"type": "string"}}
-                        ],
-                        "description": (
-                            "Ticker symbol or list of symbols "
-                            "(e.g., 'TSLA' or ['TSLA', 'F', 'GM'])"
-                        ),
-                    }
-                },
-                "required": ["symbol"]
-            }
+            inputSchema=_TICKER_SCHEMA,
         ),
-        Tool(
+        Tool.model_construct(
             name="ticker_options",
-            description="""
+            description=f"""
 Options chain analysis screen - comprehensive positioning, IV, Greeks, unusual activity.
 
 Shows EVERYTHING:
@@ -208,25 +235,101 @@ INTERPRETATION
 • Calls IV elevated: 4.0% above puts
 • Term structure contango: market pricing vol compression from 55.5% → 47.5%
 
-Output: BBG Lite formatted text (dense, scannable, professional).
+{_OUTPUT_FORMAT_LINE}
 Context delivery system - NO recommendations.
 
 Navigation: Back to ticker('PALL') for price/factor data
 """,
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {
-                        "type": "string",
-                        "description": "Ticker symbol (e.g., 'PALL', 'AAPL')",
-                    },
-                    "expiration": {
-                        "type": "string",
-                        "description": "Expiration date: 'nearest' (default) or 'YYYY-MM-DD'",
-                        "default": "nearest",
-                    }
-                },
-                "required": ["symbol"]
-            }
+            inputSchema=_TICKER_OPTIONS_SCHEMA,
         ),
-    ]
+    )
+
+
+# Definitions never change per process - description strings and schemas are
+# built once here, not on every list_tools handshake
+_MCP_TOOLS = _build_mcp_tools()
+
+
+def get_mcp_tools() -> tuple[Tool, ...]:
+    """
+    Return the MCP tools.
+
+    Single source of truth for tool definitions.
+    Both stdio and HTTP servers import this function.
+    Returns the prebuilt immutable tuple itself - no per-call copy (the SDK only
+    iterates it; treat the Tool objects as read-only).
+    """
+    return _MCP_TOOLS
+
+
+# Tool dispatch: name -> coroutine returning the formatted screen text.
+# Data fetches are blocking (yfinance); they run in a worker thread so one slow
+# Yahoo call doesn't stall other tool calls on the event loop. Formatters are
+# CPU-light string building and stay on the loop.
+# market_data (yfinance/pandas/numpy) is imported on first tool call, not at server
+# import - /ping-only or idle HTTP workers start fast and stay small.
+
+def _required_arg(arguments: dict[str, Any], tool: str, key: str) -> Any:  # noqa: ANN401
+    """Return arguments[key], or raise the tool's 'requires' error if missing/empty"""
+    value = arguments.get(key)
+    if not value:
+        msg = f"{tool}() requires '{key}' parameter"
+        raise ValueError(msg)
+    return value
+
+
+async def _markets(_arguments: dict[str, Any]) -> str:
+    from .market_data import format_markets, get_markets_data  # noqa: PLC0415
+
+    return format_markets(await asyncio.to_thread(get_markets_data))
+
+
+async def _sector(arguments: dict[str, Any]) -> str:
+    from .market_data import format_sector, get_sector_data  # noqa: PLC0415
+
+    sector_name = _required_arg(arguments, "sector", "name")
+    return format_sector(await asyncio.to_thread(get_sector_data, sector_name))
+
+
+async def _ticker(arguments: dict[str, Any]) -> str:
+    from .market_data import (  # noqa: PLC0415
+        format_ticker,
+        format_ticker_batch,
+        get_ticker_screen_data,
+        get_ticker_screen_data_batch,
+    )
+
+    symbol = _required_arg(arguments, "ticker", "symbol")
+
+    # Check if batch mode (list) or single mode (string)
+    if isinstance(symbol, list):
+        # Batch comparison mode - use batch API to avoid hammering Yahoo
+        return format_ticker_batch(await asyncio.to_thread(get_ticker_screen_data_batch, symbol))
+
+    # Single ticker mode
+    return format_ticker(await asyncio.to_thread(get_ticker_screen_data, symbol))
+
+
+async def _ticker_options(arguments: dict[str, Any]) -> str:
+    from .market_data import format_options, get_options_data  # noqa: PLC0415
+
+    symbol = _required_arg(arguments, "ticker_options", "symbol")
+    expiration = arguments.get("expiration", "nearest")
+    return format_options(await asyncio.to_thread(get_options_data, symbol, expiration))
+
+
+TOOL_HANDLERS: dict[str, Callable[[dict[str, Any]], Awaitable[str]]] = {
+    "markets": _markets,
+    "sector": _sector,
+    "ticker": _ticker,
+    "ticker_options": _ticker_options,
+}
+
+
+async def run_tool(name: str, arguments: dict[str, Any]) -> str:
+    """Fetch and format one tool call - O(1) dispatch through TOOL_HANDLERS"""
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
+        msg = f"Unknown tool: {name}"
+        raise ValueError(msg)
+    return await handler(arguments)
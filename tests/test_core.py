@@ -5,14 +5,33 @@ Demonstrates proper separation of concerns
 """
 
 import sys
+import threading
+import time
+from itertools import pairwise
 from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
 
 # Add project root to path so we can import mcp_yfinance_ux
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from mcp_yfinance_ux import historical
 from mcp_yfinance_ux.market_data import (
+    _INFLIGHT,
+    _coalesce,
+    _history_records,
+    _max_pain_prefix_sums,
+    _option_records,
+    _top_rows,
+    calculate_max_pain,
+    calculate_rsi,
     is_market_open,
+    normalize_ticker_symbol,
+    ttl_cache,
     get_ticker_data,
     get_market_snapshot,
     format_market_snapshot,
@@ -44,6 +63,306 @@ def test_market_snapshot():
     print("✓ Market snapshot works")
 
 
+def test_normalize_symbol():
+    """Test symbol normalization and early rejection of malformed symbols"""
+    assert normalize_ticker_symbol("BRK.B") == "BRK-B"
+    assert normalize_ticker_symbol("BRK/A") == "BRK-A"
+    assert normalize_ticker_symbol("NEO.TO") == "NEO.TO"
+    assert normalize_ticker_symbol("^GSPC") == "^GSPC"
+    assert normalize_ticker_symbol("ES=F") == "ES=F"
+    assert normalize_ticker_symbol(" tsla ") == "tsla"
+    assert normalize_ticker_symbol("M&M.NS") == "M&M.NS"  # '&' in NSE symbols
+    assert normalize_ticker_symbol("BAJAJ-AUTO.NS") == "BAJAJ-AUTO.NS"
+    assert normalize_ticker_symbol("A" * 20) == "A" * 20  # Long, still well-formed
+
+    for bad in ["", "TS LA", "AAPL;DROP", "$TSLA", "A" * 40]:
+        with pytest.raises(ValueError, match="Invalid symbol"):
+            normalize_ticker_symbol(bad)
+    print("✓ Symbol normalization works")
+
+
+def _reference_rsi(prices, period=14):
+    """Wilder RSI, the textbook way: SMA seed, then a sequential smoothing loop"""
+    deltas = [cur - prev for prev, cur in pairwise(prices)]
+    gains = [max(d, 0.0) for d in deltas]
+    losses = [max(-d, 0.0) for d in deltas]
+    avg_gain = sum(gains[:period]) / period
+    avg_loss = sum(losses[:period]) / period
+    for gain, loss in zip(gains[period:], losses[period:], strict=True):
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+    if avg_loss == 0:
+        return 100.0 if avg_gain > 0 else None
+    return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+def test_rsi():
+    """Test closed-form RSI against a reference Wilder loop (no network)"""
+    assert calculate_rsi([10.0] * 10) is None  # Not enough history
+
+    rng = np.random.default_rng(42)
+    walks = [(100 + rng.normal(0, 1, size).cumsum()).tolist() for size in (15, 22, 60, 252)]
+    edge_cases = [
+        [float(p) for p in range(1, 30)],  # Only gains
+        [float(p) for p in range(30, 1, -1)],  # Only losses
+        [10.0] * 30,  # Flat - undefined
+    ]
+    for prices in walks + edge_cases:
+        expected = _reference_rsi(prices)
+        rsi = calculate_rsi(prices)
+        if expected is None:
+            assert rsi is None
+        else:
+            assert rsi == pytest.approx(expected, rel=1e-9)
+    print("✓ RSI works")
+
+
+def test_request_coalescing():
+    """Test concurrent identical lookups share one upstream fetch"""
+    calls = []
+
+    def slow_fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"symbol": "TEST"}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(_coalesce(("test", "TEST"), slow_fetch)))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert results == [{"symbol": "TEST"}] * 5
+    assert ("test", "TEST") not in _INFLIGHT  # Completed fetches don't linger
+
+    # A failed fetch is cleaned up too, and the next call fetches again
+    def failing_fetch():
+        calls.append(1)
+        msg = "upstream down"
+        raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError):
+        _coalesce(("test", "FAIL"), failing_fetch)
+    assert ("test", "FAIL") not in _INFLIGHT
+    _coalesce(("test", "TEST"), slow_fetch)
+    assert calls == [1, 1, 1]  # Fresh fetch - nothing cached
+    print("✓ Request coalescing works")
+
+
+def test_ttl_cache():
+    """Test per-symbol TTL cache reuses results and skips failed fetches"""
+    calls = []
+
+    @ttl_cache(60)
+    def fake_factor(symbol):
+        calls.append(symbol)
+        return {"value": None} if symbol == "BAD" else {"value": 1.0}
+
+    assert fake_factor("AAPL") == {"value": 1.0}
+    assert fake_factor("AAPL") == {"value": 1.0}
+    fake_factor("BAD")
+    fake_factor("BAD")
+    assert calls == ["AAPL", "BAD", "BAD"]
+
+    fake_factor.cache_clear()
+    fake_factor("AAPL")
+    assert calls[-1] == "AAPL"
+
+    # Pre-fetched data (positional or keyword) is cached apart from the live path
+    @ttl_cache(60, max_entries=2)
+    def sourced_factor(symbol, closes=None, target_dates=None):  # noqa: ARG001
+        calls.append((symbol, closes))
+        return {"value": 1.0 if closes is None else closes}
+
+    assert sourced_factor("AAPL") == {"value": 1.0}
+    assert sourced_factor("AAPL", closes=2.0) == {"value": 2.0}
+    assert sourced_factor("AAPL", 2.0) == {"value": 2.0}
+    assert sourced_factor("AAPL") == {"value": 1.0}
+    # Only target_dates given: still the live path, shares the live entry
+    assert sourced_factor("AAPL", None, ("d1", "d2", "d3")) == {"value": 1.0}
+    assert sourced_factor("AAPL", target_dates=("d1", "d2", "d3")) == {"value": 1.0}
+
+    # Least recently used entry is evicted past max_entries
+    calls.clear()
+    sourced_factor("MSFT")  # Evicts ("AAPL", prefetched)
+    sourced_factor("AAPL")
+    sourced_factor("AAPL", 2.0)
+    assert calls == [("MSFT", None), ("AAPL", 2.0)]
+    print("✓ TTL cache works")
+
+
+def test_bounded_ttl_cache():
+    """Test module TTL caches sweep expired entries and stay within max_entries"""
+    cache = {}
+    for symbol in ["A", "B", "C"]:
+        historical._cache_put(cache, symbol, {"symbol": symbol}, 60, max_entries=2)
+    assert list(cache) == ["B", "C"]  # Oldest insert dropped at capacity
+
+    cache["B"] = (time.monotonic() - 120, {"symbol": "B"})  # Expired
+    historical._cache_put(cache, "D", {"symbol": "D"}, 60, max_entries=2)
+    assert list(cache) == ["C", "D"]  # Expired entry swept before evicting live ones
+
+    historical._cache_put(cache, "C", {"symbol": "C"}, 60, max_entries=2)
+    assert list(cache) == ["D", "C"]  # Refresh moves the key to the end
+    print("✓ Bounded TTL cache works")
+
+
+def test_history_records():
+    """Test get_ticker_history rows match hist.to_dict('records') exactly"""
+    dates = pd.date_range("2025-01-02", periods=5, tz="America/New_York")
+    hist = pd.DataFrame(
+        {
+            "Open": [1.0, np.nan, 3.0, 4.0, 5.0],
+            "Close": [1.5, 2.5, 3.5, 4.5, 5.5],
+            "Volume": [100, 200, 300, 400, 500],
+            "Stock Splits": [0.0] * 5,
+        },
+        index=dates,
+    )
+    records = _history_records(hist)
+    expected = hist.to_dict("records")
+    assert [list(row) for row in records] == [list(row) for row in expected]
+    for row, expected_row in zip(records, expected, strict=True):
+        for key, value in row.items():
+            assert type(value) is type(expected_row[key])
+            assert value == expected_row[key] or (np.isnan(value) and np.isnan(expected_row[key]))
+    print("✓ History records work")
+
+
+def _reference_max_pain(call_strikes, call_oi, put_strikes, put_oi):
+    """Max pain by brute force: total pain at every strike, lowest strike wins ties"""
+    calls = list(zip(call_strikes, np.nan_to_num(call_oi), strict=True))
+    puts = list(zip(put_strikes, np.nan_to_num(put_oi), strict=True))
+    best_strike, best_pain = 0.0, float("inf")
+    for strike in sorted(set(call_strikes) | set(put_strikes)):
+        pain = sum(max(0.0, strike - s) * oi for s, oi in calls)
+        pain += sum(max(0.0, s - strike) * oi for s, oi in puts)
+        if pain < best_pain:
+            best_strike, best_pain = strike, pain
+    return best_strike
+
+
+def test_max_pain():
+    """Test broadcast and prefix-sum max pain against brute force (no network)"""
+    rng = np.random.default_rng(7)
+    # Integer strikes/OI keep every sum exact, so ties resolve identically
+    for n_strikes in (1, 5, 40, 300):  # 300 > MAX_PAIN_BROADCAST_LIMIT: prefix sums
+        for _ in range(10):
+            c_strikes = rng.choice(np.arange(50.0, 50 + 2 * n_strikes), n_strikes, replace=False)
+            p_strikes = rng.choice(np.arange(50.0, 50 + 2 * n_strikes), n_strikes, replace=False)
+            c_oi = rng.integers(0, 500, n_strikes).astype(float)
+            p_oi = rng.integers(0, 500, n_strikes).astype(float)
+            c_oi[rng.choice(n_strikes, n_strikes // 10, replace=False)] = np.nan  # Missing -> 0
+
+            expected = _reference_max_pain(c_strikes, c_oi, p_strikes, p_oi)
+            assert calculate_max_pain(c_strikes, c_oi, p_strikes, p_oi) == expected
+
+            # Prefix sums give the same pain curve as the payoff matrix
+            candidates = np.union1d(c_strikes, p_strikes)
+            c_oi0, p_oi0 = np.nan_to_num(c_oi), np.nan_to_num(p_oi)
+            call_pain, put_pain = _max_pain_prefix_sums(
+                candidates, c_strikes, c_oi0, p_strikes, p_oi0
+            )
+            payoff_calls = np.maximum(candidates[:, None] - c_strikes[None, :], 0.0) @ c_oi0
+            payoff_puts = np.maximum(p_strikes[None, :] - candidates[:, None], 0.0) @ p_oi0
+            assert np.array_equal(call_pain, payoff_calls)
+            assert np.array_equal(put_pain, payoff_puts)
+
+    assert calculate_max_pain([], [], [], []) == 0.0
+    print("✓ Max pain works")
+
+
+def test_top_rows():
+    """Test np.partition top-k threshold matches DataFrame.nlargest row for row (no network)"""
+    rng = np.random.default_rng(11)
+    for n_rows in (0, 3, 10, 25, 200):
+        for _ in range(10):
+            # Small integer values force ties, including at the top-10 cut-off
+            frame = pd.DataFrame(
+                {
+                    "strike": np.arange(n_rows, dtype=float) + 100,
+                    "openInterest": rng.integers(0, 8, n_rows).astype(float),
+                    "volume": rng.integers(0, 8, n_rows).astype(float),
+                    "lastPrice": rng.random(n_rows),
+                    "impliedVolatility": rng.random(n_rows),
+                }
+            )
+            frame.loc[rng.choice(n_rows, n_rows // 5, replace=False), "openInterest"] = np.nan
+            for column in ("openInterest", "volume"):
+                values = frame[column].to_numpy(dtype=np.float64)
+                expected = _option_records(frame.nlargest(10, column))
+                actual = _top_rows(frame, values, 10)
+                assert pd.DataFrame(actual).equals(pd.DataFrame(expected))
+    print("✓ Top rows work")
+
+
+def test_failed_lookup_evicts_ticker():
+    """Test a failed info fetch doesn't pin its yf.Ticker for the whole TTL (no network)"""
+    outcomes = [ConnectionError("DNS failure"), {"symbol": "FAIL"}]
+    created = []
+
+    class ScriptedTicker:
+        """yf.Ticker stand-in whose .info replays outcomes (exceptions raised)"""
+
+        def __init__(self, symbol, **_kwargs):
+            created.append(symbol)
+
+        @property
+        def info(self):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+    historical.clear_ticker_cache()
+    with patch.object(historical.yf, "Ticker", ScriptedTicker):
+        with pytest.raises(ConnectionError):
+            historical.get_ticker_info("FAIL")
+        assert historical.get_ticker_info("FAIL") == {"symbol": "FAIL"}
+        assert historical.get_ticker("FAIL") is historical.get_ticker("FAIL")  # Healthy: shared
+    assert created == ["FAIL", "FAIL"]  # Fresh Ticker after the failure
+
+    # Empty/None info (failed scrape) is a clear error, not cached, not pinned
+    outcomes[:] = [None, {}, {"symbol": "FAIL"}]
+    historical.clear_ticker_cache()
+    with patch.object(historical.yf, "Ticker", ScriptedTicker):
+        for _ in range(2):
+            with pytest.raises(LookupError, match="No info data"):
+                historical.get_ticker_info("FAIL")
+        assert historical.get_ticker_info("FAIL") == {"symbol": "FAIL"}
+    assert created == ["FAIL"] * 5
+    historical.clear_ticker_cache()
+    print("✓ Failed lookups evict their Ticker")
+
+
+def test_empty_quote_not_cached():
+    """Test a failed (empty) fast_info read is retried, a good quote is cached (no network)"""
+    reads = [{}, {"lastPrice": 10.0, "previousClose": 9.5}]
+
+    class QuoteTicker:
+        def __init__(self, symbol, **_kwargs):
+            self.symbol = symbol
+
+        @property
+        def fast_info(self):
+            return reads.pop(0)
+
+    historical.clear_ticker_cache()
+    with patch.object(historical.yf, "Ticker", QuoteTicker):
+        assert historical.get_fast_info("QUOTE") == {}
+        quote = {"lastPrice": 10.0, "previousClose": 9.5}
+        assert historical.get_fast_info("QUOTE") == quote
+        assert historical.get_fast_info("QUOTE") == quote  # Cached - no third read
+    assert reads == []
+    historical.clear_ticker_cache()
+    print("✓ Empty quotes are not cached")
+
+
 def test_formatting():
     """Test formatted output"""
     data = get_market_snapshot(["futures"])
@@ -66,6 +385,36 @@ if __name__ == "__main__":
     test_market_snapshot()
     print()
 
+    test_normalize_symbol()
+    print()
+
+    test_rsi()
+    print()
+
+    test_request_coalescing()
+    print()
+
+    test_ttl_cache()
+    print()
+
+    test_bounded_ttl_cache()
+    print()
+
+    test_history_records()
+    print()
+
+    test_max_pain()
+    print()
+
+    test_top_rows()
+    print()
+
+    test_failed_lookup_evicts_ticker()
+    print()
+
+    test_empty_quote_not_cached()
+    print()
+
     test_formatting()
     print()
 